@@ -40,16 +40,31 @@ Usage:
     )
 """
 
-import json
 import logging
+import os
+import queue
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from typing import (
+    TYPE_CHECKING, Any, ClassVar, Dict, Iterator, List, Optional, Sequence, Tuple, Type,
+    TypeVar
+)
+from uuid import UUID
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from sdd.agents.shared.models import AgentContext, AgentInput, AgentOutput
+from sdd.utils import json_dumps
+
+if TYPE_CHECKING:
+    from pydantic.plugin._schema_validator import PluggableSchemaValidator
+    from pydantic_core import SchemaValidator
 
 # Configure structured logging (Principle VII)
 logging.basicConfig(
@@ -58,39 +73,128 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _uuid7() -> str:
+    """
+    Generate a time-ordered UUIDv7 string (RFC 9562).
+
+    48-bit Unix millisecond timestamp followed by 74 random bits, so IDs
+    sort lexicographically by creation time (to the millisecond) and audit
+    records can be ordered by ID without parsing timestamps.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(UUID(int=value))
+
+
+# ===================================================================
+# Read-Only Views
+# ===================================================================
+
+class _ReadOnlyList(Sequence[T]):
+    """
+    Zero-copy, read-only view over a live list.
+
+    Reflects later appends to (and clearing of) the underlying list. Callers
+    that need a stable snapshot should use the ``*_copy`` accessors instead.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: List[T]):
+        self._items = items
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _ReadOnlyList):
+            return self._items == other._items
+        return self._items == other
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
+
 
 # ===================================================================
 # Communication Models
 # ===================================================================
 
+@dataclass(slots=True)
 class MessageEnvelope:
     """
     Message envelope for agent communication.
 
     Wraps AgentInput/AgentOutput with metadata for routing and audit.
+    Slotted plain transport record: payloads are validated by their own
+    models. AgentChannel recycles envelopes through a bounded freelist
+    (acquire/release), so an envelope must not be retained after release.
 
     Attributes:
-        message_id: Unique identifier for message
-        timestamp: When message was created
-        sender: Sender agent ID (optional)
         receiver: Receiver agent ID
         payload: AgentInput or AgentOutput
+        sender: Sender agent ID (optional)
         metadata: Additional metadata
+        message_id: Unique, time-ordered identifier for message (UUIDv7)
+        timestamp: When message was created
     """
 
-    def __init__(
-        self,
+    receiver: str
+    payload: AgentInput | AgentOutput
+    sender: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    message_id: str = field(default_factory=_uuid7)
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    _pool: ClassVar[deque["MessageEnvelope"]] = deque(maxlen=1024)
+
+    def __post_init__(self) -> None:
+        # Interned: receive() compares receiver against agent IDs per message
+        self.receiver = sys.intern(self.receiver)
+        if self.sender is not None:
+            self.sender = sys.intern(self.sender)
+        if self.metadata is None:  # Callers may still pass metadata=None
+            self.metadata = {}
+
+    @classmethod
+    def acquire(
+        cls,
         receiver: str,
         payload: AgentInput | AgentOutput,
         sender: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
-    ):
-        self.message_id = str(uuid4())
-        self.timestamp = datetime.now()
-        self.sender = sender
-        self.receiver = receiver
-        self.payload = payload
-        self.metadata = metadata or {}
+    ) -> "MessageEnvelope":
+        """Get an envelope from the freelist (or allocate one) with fresh ID/timestamp."""
+        metadata = metadata if metadata is not None else {}
+        try:
+            envelope = cls._pool.pop()
+        except IndexError:
+            return cls(receiver, payload, sender, metadata)
+
+        envelope.receiver = receiver
+        envelope.payload = payload
+        envelope.sender = sender
+        envelope.metadata = metadata
+        envelope.message_id = _uuid7()
+        envelope.timestamp = datetime.now()
+        envelope.__post_init__()
+        return envelope
+
+    @classmethod
+    def release(cls, envelope: "MessageEnvelope") -> None:
+        """Drop payload references and return envelope to the freelist."""
+        envelope.payload = None  # type: ignore[assignment]
+        envelope.metadata = None  # type: ignore[assignment]
+        cls._pool.append(envelope)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -100,37 +204,31 @@ class MessageEnvelope:
             'sender': self.sender,
             'receiver': self.receiver,
             'payload_type': type(self.payload).__name__,
-            'payload': self.payload.model_dump(),
+            'payload': self.payload.model_dump(mode='json'),
             'metadata': self.metadata
         }
 
 
+@dataclass(slots=True, frozen=True)
 class HandoffRecord:
     """
     Record of context handoff between agents.
 
     Attributes:
-        handoff_id: Unique identifier
-        timestamp: When handoff occurred
         from_agent: Source agent ID
         to_agent: Destination agent ID
         context: AgentContext being handed off
         reason: Reason for handoff (optional)
+        handoff_id: Unique, time-ordered identifier (UUIDv7)
+        timestamp: When handoff occurred
     """
 
-    def __init__(
-        self,
-        from_agent: str,
-        to_agent: str,
-        context: AgentContext,
-        reason: Optional[str] = None
-    ):
-        self.handoff_id = str(uuid4())
-        self.timestamp = datetime.now()
-        self.from_agent = from_agent
-        self.to_agent = to_agent
-        self.context = context
-        self.reason = reason
+    from_agent: str
+    to_agent: str
+    context: AgentContext
+    reason: Optional[str] = None
+    handoff_id: str = field(default_factory=_uuid7)
+    timestamp: datetime = field(default_factory=datetime.now)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -139,11 +237,141 @@ class HandoffRecord:
             'timestamp': self.timestamp.isoformat(),
             'from_agent': self.from_agent,
             'to_agent': self.to_agent,
-            'context': self.context.model_dump(),
+            'context': self.context.model_dump(mode='json'),
             'reason': self.reason
         }
 
 
+# ===================================================================
+# Audit Trail Writer
+# ===================================================================
+
+# Upper bound on iovecs per writev call (POSIX guarantees at least 16;
+# Linux/macOS allow 1024)
+_MAX_IOVECS = 1024
+
+
+def _write_all(fd: int, chunks: List[bytes]) -> None:
+    """Write chunks to fd with gather I/O, resuming after partial writes."""
+    if not hasattr(os, "writev"):  # Windows
+        data = memoryview(b"".join(chunks))
+        while data:
+            data = data[os.write(fd, data):]
+        return
+
+    for start in range(0, len(chunks), _MAX_IOVECS):
+        batch = chunks[start:start + _MAX_IOVECS]
+        written = os.writev(fd, batch)
+        remaining = sum(len(chunk) for chunk in batch) - written
+        if remaining:
+            tail = memoryview(b"".join(batch))[written:]
+            while tail:
+                tail = tail[os.write(fd, tail):]
+
+
+class _AuditWriter:
+    """
+    Buffered JSONL appender for audit trail files.
+
+    Records are serialized immediately (so callers may reuse the source
+    objects) and queued per file; once batch_size records are pending for
+    a file they are appended with a single gather write.
+    """
+
+    def __init__(self, batch_size: int = 32):
+        self.batch_size = max(1, batch_size)
+        self._pending: Dict[Path, List[bytes]] = {}
+        self._lock = threading.Lock()
+
+    def write(self, path: Path, record: Dict[str, Any]) -> None:
+        """Queue one JSONL record for path, flushing the file's batch if full."""
+        line = json_dumps(record) + b"\n"
+        with self._lock:
+            pending = self._pending.setdefault(path, [])
+            pending.append(line)
+            if len(pending) >= self.batch_size:
+                self._flush_file(path, pending)
+
+    def flush(self) -> None:
+        """Append all pending records to their files."""
+        with self._lock:
+            for path, pending in self._pending.items():
+                if pending:
+                    self._flush_file(path, pending)
+
+    def close(self) -> None:
+        """Flush pending records and release resources."""
+        self.flush()
+
+    @staticmethod
+    def _flush_file(path: Path, pending: List[bytes]) -> None:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            _write_all(fd, pending)
+        finally:
+            os.close(fd)
+        pending.clear()
+
+
+class _BackgroundAuditWriter(_AuditWriter):
+    """
+    Audit writer that performs file appends on a daemon thread.
+
+    Callers only serialize and enqueue a record (submission); the worker
+    drains everything queued so far and appends it with one gather write
+    per file (completion). Bursts therefore coalesce naturally and the
+    sending thread never blocks on disk I/O.
+    """
+
+    def __init__(self, batch_size: int = 32):
+        super().__init__(batch_size)
+        self._queue: "queue.Queue[Optional[Tuple[Path, bytes]]]" = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._run, name="agent-channel-audit", daemon=True
+        )
+        self._worker.start()
+
+    def write(self, path: Path, record: Dict[str, Any]) -> None:
+        """Serialize record and hand it to the writer thread."""
+        self._queue.put((path, json_dumps(record) + b"\n"))
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._worker.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread."""
+        if self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join()
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            try:
+                while True:
+                    items.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            pending: Dict[Path, List[bytes]] = {}
+            for item in items:
+                if item is not None:
+                    pending.setdefault(item[0], []).append(item[1])
+            try:
+                for path, lines in pending.items():
+                    self._flush_file(path, lines)
+            except OSError as e:
+                logger.error("Audit trail write failed: %s", e)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+            if None in items:
+                return
+
+
 # ===================================================================
 # AgentChannel
 # ===================================================================
@@ -157,32 +385,45 @@ class AgentChannel:
 
     Attributes:
         audit_dir: Directory for communication audit trail
-        message_queue: In-memory message queue (FIFO)
+        message_queue: In-memory message queue (FIFO deque, guarded by a condition)
         invocation_chain: List of agent invocations in current workflow
         handoff_history: List of context handoffs
     """
 
     def __init__(
         self,
-        audit_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/communication"
+        audit_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/communication",
+        audit_batch_size: int = 32,
+        background_audit: bool = False
     ):
         """
         Initialize Agent Channel.
 
         Args:
             audit_dir: Directory for audit trail storage
+            audit_batch_size: Audit records buffered per file before a write
+                (1 = write every record immediately)
+            background_audit: Append audit records from a dedicated writer
+                thread instead of the calling thread
         """
         self.audit_dir = Path(audit_dir)
         self.audit_dir.mkdir(parents=True, exist_ok=True)
 
-        # Message queue
-        self.message_queue: List[MessageEnvelope] = []
+        # Audit trail writer (pending records are flushed on export, clear,
+        # flush_audit(), garbage collection, and interpreter exit)
+        writer_cls = _BackgroundAuditWriter if background_audit else _AuditWriter
+        self._audit_writer = writer_cls(audit_batch_size)
+        weakref.finalize(self, self._audit_writer.close)
+
+        # Message queue (condition guards the queue and wakes blocking receivers)
+        self.message_queue: deque[MessageEnvelope] = deque()
+        self._not_empty = threading.Condition()
 
         # Invocation tracking
         self.invocation_chain: List[str] = []
         self.handoff_history: List[HandoffRecord] = []
 
-        logger.info(f"AgentChannel initialized: audit_dir={self.audit_dir}")
+        logger.info("AgentChannel initialized: audit_dir=%s", self.audit_dir)
 
     def send(
         self,
@@ -223,46 +464,50 @@ class AgentChannel:
             # Re-validate to ensure contract compliance
             AgentInput.model_validate(agent_input.model_dump())
         except ValidationError as e:
-            logger.error(f"AgentInput validation failed: {e}")
+            logger.error("AgentInput validation failed: %s", e)
             raise
 
         # Create message envelope
-        envelope = MessageEnvelope(
+        envelope = MessageEnvelope.acquire(
             receiver=agent_input.agent_id,
             payload=agent_input,
             sender=sender,
             metadata={'timeout_seconds': timeout_seconds}
         )
 
-        # Add to queue
-        self.message_queue.append(envelope)
-
-        # Track invocation
-        self.invocation_chain.append(agent_input.agent_id)
-
-        # Log communication
+        # Log communication and audit before enqueueing: once queued, a
+        # receiver may recycle the envelope at any time
+        message_id = envelope.message_id
         logger.info(
-            f"Message sent: id={envelope.message_id}, "
-            f"sender={sender}, receiver={agent_input.agent_id}, "
-            f"task_id={agent_input.task_id}"
+            "Message sent: id=%s, sender=%s, receiver=%s, task_id=%s",
+            message_id, sender, agent_input.agent_id, agent_input.task_id
         )
-
-        # Audit trail
         self._audit_message(envelope)
 
-        return envelope.message_id
+        # Add to queue and track invocation
+        with self._not_empty:
+            self.message_queue.append(envelope)
+            self.invocation_chain.append(agent_input.agent_id)
+            self._not_empty.notify_all()
+
+        return message_id
 
     def receive(
         self,
         agent_id: Optional[str] = None,
-        timeout_seconds: int = 300
+        timeout_seconds: int = 300,
+        block: bool = False
     ) -> Optional[AgentInput]:
         """
         Receive message from queue.
 
+        Safe to call from multiple threads. By default returns immediately;
+        with block=True waits up to timeout_seconds for a matching message.
+
         Args:
             agent_id: Filter to messages for specific agent (None = any)
-            timeout_seconds: Receive timeout (unused currently, for future)
+            timeout_seconds: Maximum wait when block=True
+            block: Wait for a matching message instead of returning None
 
         Returns:
             AgentInput if message available, None otherwise
@@ -273,19 +518,36 @@ class AgentChannel:
             >>> if agent_input:
             ...     print(f"Received message for task: {agent_input.task_id}")
         """
-        # Find matching message
-        for i, envelope in enumerate(self.message_queue):
-            if agent_id is None or envelope.receiver == agent_id:
-                # Remove from queue
-                self.message_queue.pop(i)
+        deadline = time.monotonic() + timeout_seconds
+        with self._not_empty:
+            envelope = self._pop_matching(agent_id)
+            while envelope is None and block:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._not_empty.wait(remaining)
+                envelope = self._pop_matching(agent_id)
+        if envelope is None:
+            return None
 
-                logger.info(
-                    f"Message received: id={envelope.message_id}, "
-                    f"receiver={envelope.receiver}"
-                )
-
-                return envelope.payload
+        logger.info(
+            "Message received: id=%s, receiver=%s",
+            envelope.message_id, envelope.receiver
+        )
 
+        payload = envelope.payload
+        MessageEnvelope.release(envelope)
+        return payload
+
+    def _pop_matching(self, agent_id: Optional[str]) -> Optional[MessageEnvelope]:
+        """Remove and return the oldest envelope for agent_id (caller holds lock)."""
+        pending = self.message_queue
+        if agent_id is None:
+            return pending.popleft() if pending else None
+        for i, envelope in enumerate(pending):
+            if envelope.receiver == agent_id:
+                del pending[i]
+                return envelope
         return None
 
     def respond(
@@ -323,11 +585,11 @@ class AgentChannel:
         try:
             AgentOutput.model_validate(agent_output.model_dump())
         except ValidationError as e:
-            logger.error(f"AgentOutput validation failed: {e}")
+            logger.error("AgentOutput validation failed: %s", e)
             raise
 
         # Create message envelope
-        envelope = MessageEnvelope(
+        envelope = MessageEnvelope.acquire(
             receiver=receiver or "orchestrator",
             payload=agent_output,
             sender=agent_output.agent_id
@@ -335,14 +597,16 @@ class AgentChannel:
 
         # Log communication
         logger.info(
-            f"Response sent: id={envelope.message_id}, "
-            f"sender={agent_output.agent_id}, success={agent_output.success}"
+            "Response sent: id=%s, sender=%s, success=%s",
+            envelope.message_id, agent_output.agent_id, agent_output.success
         )
 
-        # Audit trail
+        # Audit trail (responses are not queued, so recycle immediately)
         self._audit_message(envelope)
+        message_id = envelope.message_id
+        MessageEnvelope.release(envelope)
 
-        return envelope.message_id
+        return message_id
 
     def handoff(
         self,
@@ -386,8 +650,8 @@ class AgentChannel:
         self.handoff_history.append(handoff)
 
         logger.info(
-            f"Context handoff: id={handoff.handoff_id}, "
-            f"from={from_agent}, to={to_agent}, reason={reason}"
+            "Context handoff: id=%s, from=%s, to=%s, reason=%s",
+            handoff.handoff_id, from_agent, to_agent, reason
         )
 
         # Audit trail
@@ -395,12 +659,16 @@ class AgentChannel:
 
         return handoff.handoff_id
 
-    def get_invocation_chain(self) -> List[str]:
+    def get_invocation_chain(self) -> Sequence[str]:
         """
         Get agent invocation chain for current workflow.
 
+        Returns a read-only view backed by the live chain (no copy). The view
+        reflects later invocations; use get_invocation_chain_copy() for a
+        snapshot.
+
         Returns:
-            List of agent IDs in invocation order
+            Read-only sequence of agent IDs in invocation order
 
         Example:
             >>> channel = AgentChannel()
@@ -408,14 +676,27 @@ class AgentChannel:
             >>> chain = channel.get_invocation_chain()
             >>> print(" -> ".join(chain))
         """
+        return _ReadOnlyList(self.invocation_chain)
+
+    def get_invocation_chain_copy(self) -> List[str]:
+        """
+        Get a snapshot copy of the agent invocation chain.
+
+        Returns:
+            List of agent IDs in invocation order (safe to mutate)
+        """
         return self.invocation_chain.copy()
 
-    def get_handoff_history(self) -> List[HandoffRecord]:
+    def get_handoff_history(self) -> Sequence[HandoffRecord]:
         """
         Get context handoff history.
 
+        Returns a read-only view backed by the live history (no copy). The
+        view reflects later handoffs; use get_handoff_history_copy() for a
+        snapshot.
+
         Returns:
-            List of HandoffRecord instances
+            Read-only sequence of HandoffRecord instances
 
         Example:
             >>> channel = AgentChannel()
@@ -424,6 +705,15 @@ class AgentChannel:
             >>> for h in history:
             ...     print(f"{h.from_agent} -> {h.to_agent}: {h.reason}")
         """
+        return _ReadOnlyList(self.handoff_history)
+
+    def get_handoff_history_copy(self) -> List[HandoffRecord]:
+        """
+        Get a snapshot copy of the context handoff history.
+
+        Returns:
+            List of HandoffRecord instances (safe to mutate)
+        """
         return self.handoff_history.copy()
 
     def clear(self) -> None:
@@ -435,15 +725,18 @@ class AgentChannel:
             >>> # ... workflow complete ...
             >>> channel.clear()
         """
-        self.message_queue.clear()
-        self.invocation_chain.clear()
-        self.handoff_history.clear()
+        self.flush_audit()
+        with self._not_empty:
+            self.message_queue.clear()
+            self.invocation_chain.clear()
+            self.handoff_history.clear()
         logger.info("AgentChannel cleared")
 
     def export_audit_trail(
         self,
         task_id: str,
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        pretty: bool = False
     ) -> str:
         """
         Export complete audit trail for task.
@@ -451,6 +744,7 @@ class AgentChannel:
         Args:
             task_id: Task identifier
             output_path: Path to save audit trail (default: audit_dir/{task_id}_audit.json)
+            pretty: Indent JSON for human reading (default: compact)
 
         Returns:
             Path to exported audit trail
@@ -466,38 +760,69 @@ class AgentChannel:
         if output_path is None:
             output_path = str(self.audit_dir / f"{task_id}_audit.json")
 
-        audit_data = {
-            'task_id': task_id,
-            'generated_at': datetime.now().isoformat(),
-            'invocation_chain': self.invocation_chain,
-            'handoff_history': [h.to_dict() for h in self.handoff_history],
-            'message_count': len(self.message_queue)
-        }
+        self.flush_audit()
 
+        generated_at = datetime.now().isoformat()
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(json.dumps(audit_data, indent=2))
 
-        logger.info(f"Audit trail exported: {output_path}")
+        if pretty:
+            audit_data = {
+                'task_id': task_id,
+                'generated_at': generated_at,
+                'invocation_chain': self.invocation_chain,
+                'handoff_history': [h.to_dict() for h in self.handoff_history],
+                'message_count': len(self.message_queue)
+            }
+            output_file.write_bytes(json_dumps(audit_data, pretty=True))
+        else:
+            # Stream one handoff at a time instead of materializing the
+            # whole document (memory stays flat for long workflows)
+            with open(output_file, 'wb') as f:
+                f.write(b'{"task_id":' + json_dumps(task_id))
+                f.write(b',"generated_at":' + json_dumps(generated_at))
+                f.write(b',"invocation_chain":' + json_dumps(self.invocation_chain))
+                f.write(b',"handoff_history":[')
+                for i, handoff in enumerate(self.handoff_history):
+                    if i:
+                        f.write(b',')
+                    f.write(json_dumps(handoff.to_dict()))
+                f.write(b'],"message_count":' + json_dumps(len(self.message_queue)) + b'}')
+
+        logger.info("Audit trail exported: %s", output_path)
         return str(output_file)
 
+    def flush_audit(self) -> None:
+        """
+        Write any buffered audit records to messages.jsonl / handoffs.jsonl.
+
+        Example:
+            >>> channel = AgentChannel()
+            >>> # ... burst of messages ...
+            >>> channel.flush_audit()
+        """
+        self._audit_writer.flush()
+
     def _audit_message(self, envelope: MessageEnvelope) -> None:
         """Write message to audit trail."""
-        audit_file = self.audit_dir / "messages.jsonl"
-        with open(audit_file, 'a') as f:
-            f.write(json.dumps(envelope.to_dict()) + '\n')
+        self._audit_writer.write(self.audit_dir / "messages.jsonl", envelope.to_dict())
 
     def _audit_handoff(self, handoff: HandoffRecord) -> None:
         """Write handoff to audit trail."""
-        audit_file = self.audit_dir / "handoffs.jsonl"
-        with open(audit_file, 'a') as f:
-            f.write(json.dumps(handoff.to_dict()) + '\n')
+        self._audit_writer.write(self.audit_dir / "handoffs.jsonl", handoff.to_dict())
 
 
 # ===================================================================
 # Utility Functions
 # ===================================================================
 
+# Prebuilt pydantic-core validators for the message contracts
+_VALIDATORS: Dict[type, "SchemaValidator | PluggableSchemaValidator"] = {
+    AgentInput: AgentInput.__pydantic_validator__,
+    AgentOutput: AgentOutput.__pydantic_validator__,
+}
+
+
 def validate_agent_communication_contract(
     agent_input: AgentInput,
     agent_output: AgentOutput
@@ -518,32 +843,32 @@ def validate_agent_communication_contract(
         >>> if validate_agent_communication_contract(agent_input, agent_output):
         ...     print("Contract satisfied")
     """
-    # Check that agent IDs match
-    if agent_input.agent_id != agent_output.agent_id:
-        logger.error(
-            f"Agent ID mismatch: input={agent_input.agent_id}, "
-            f"output={agent_output.agent_id}"
-        )
-        return False
-
-    # Check that task IDs match
-    if agent_input.task_id != agent_output.task_id:
-        logger.error(
-            f"Task ID mismatch: input={agent_input.task_id}, "
-            f"output={agent_output.task_id}"
-        )
-        return False
+    # Agent IDs are interned by the models, so the first compare is an
+    # identity check; log formatting only happens on the failure path
+    if (
+        agent_input.agent_id == agent_output.agent_id
+        and agent_input.task_id == agent_output.task_id
+    ):
+        return True
 
-    logger.debug("Agent communication contract validated successfully")
-    return True
+    logger.error(
+        "Agent communication contract mismatch: input=%s/%s, output=%s/%s",
+        agent_input.agent_id, agent_input.task_id,
+        agent_output.agent_id, agent_output.task_id
+    )
+    return False
 
 
-def serialize_agent_message(message: AgentInput | AgentOutput) -> str:
+def serialize_agent_message(
+    message: AgentInput | AgentOutput,
+    indent: Optional[int] = None
+) -> str:
     """
     Serialize agent message to JSON.
 
     Args:
         message: AgentInput or AgentOutput
+        indent: Indentation for human-readable output (default: compact)
 
     Returns:
         JSON string
@@ -552,18 +877,22 @@ def serialize_agent_message(message: AgentInput | AgentOutput) -> str:
         >>> agent_input = AgentInput(...)
         >>> json_str = serialize_agent_message(agent_input)
     """
-    return message.model_dump_json(indent=2)
+    return message.model_dump_json(indent=indent)
 
 
 def deserialize_agent_message(
-    json_str: str,
-    message_type: type
+    json_str: str | bytes | Dict[str, Any],
+    message_type: Type[BaseModel]
 ) -> AgentInput | AgentOutput:
     """
     Deserialize agent message from JSON.
 
+    Validates through the model's prebuilt pydantic-core validator. Already
+    parsed dicts (e.g. audit trail payloads) are validated directly without
+    a JSON round-trip.
+
     Args:
-        json_str: JSON string
+        json_str: JSON string/bytes, or an already parsed dict
         message_type: AgentInput or AgentOutput class
 
     Returns:
@@ -576,4 +905,10 @@ def deserialize_agent_message(
         >>> json_str = '{"agent_id": "quality.verifier", ...}'
         >>> agent_input = deserialize_agent_message(json_str, AgentInput)
     """
-    return message_type.model_validate_json(json_str)
+    validator = _VALIDATORS.get(message_type) or message_type.__pydantic_validator__
+    message: AgentInput | AgentOutput
+    if isinstance(json_str, dict):
+        message = validator.validate_python(json_str)
+    else:
+        message = validator.validate_json(json_str)
+    return message
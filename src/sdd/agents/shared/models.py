@@ -31,8 +31,10 @@ Usage:
     restored = AgentInput.model_validate(json_data)
 """
 
+import sys
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import UUID
@@ -40,6 +42,50 @@ from uuid import UUID
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
+# ===================================================================
+# Validation Helpers
+# ===================================================================
+
+# Documented in the JSON schema; enforced by _check_agent_id without regex
+AGENT_ID_PATTERN = r"^[a-z_]+\.[a-z_]+$"
+_AGENT_ID_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz_")
+
+
+def _check_agent_id(v: str) -> str:
+    """
+    Validate agent_id format ({department}.{agent_name}) and intern it.
+
+    Single linear scan equivalent to AGENT_ID_PATTERN. Agent IDs come from a
+    small fixed set, so interning makes later comparisons identity checks.
+    """
+    department, _, name = v.partition(".")
+    if not (
+        department
+        and name
+        and _AGENT_ID_CHARS.issuperset(department)
+        and _AGENT_ID_CHARS.issuperset(name)
+    ):
+        raise ValueError(
+            f"agent_id must match {{department}}.{{agent_name}} "
+            f"(lowercase letters and underscores), got: {v}"
+        )
+    return sys.intern(v)
+
+
+@lru_cache(maxsize=1024)
+def _existing_path(path: str) -> str:
+    """
+    Return path if it exists on disk, raising ValueError otherwise.
+
+    Successful lookups are cached so repeated AgentContext construction does
+    not re-stat the same spec/plan files. Failures raise and are therefore
+    never cached, so a path created later validates on the next attempt.
+    """
+    if not Path(path).exists():
+        raise ValueError(f"File path does not exist: {path}")
+    return path
+
+
 # ===================================================================
 # Enumerations
 # ===================================================================
@@ -95,7 +141,7 @@ class AgentInput(BaseModel):
     agent_id: str = Field(
         ...,
         description="Unique identifier for the agent (format: {department}.{agent_name})",
-        pattern=r"^[a-z_]+\.[a-z_]+$",
+        json_schema_extra={"pattern": AGENT_ID_PATTERN},
         examples=["quality.verifier", "architecture.router", "engineering.autodebug"]
     )
 
@@ -143,6 +189,12 @@ class AgentInput(BaseModel):
         }
     }
 
+    @field_validator("agent_id")
+    @classmethod
+    def validate_agent_id(cls, v: str) -> str:
+        """Validate agent_id format and intern it."""
+        return _check_agent_id(v)
+
     @field_validator("task_id")
     @classmethod
     def validate_task_id_uuid(cls, v: str) -> str:
@@ -205,7 +257,7 @@ class AgentOutput(BaseModel):
     agent_id: str = Field(
         ...,
         description="Agent that produced this output (format: {department}.{agent_name})",
-        pattern=r"^[a-z_]+\.[a-z_]+$"
+        json_schema_extra={"pattern": AGENT_ID_PATTERN}
     )
 
     task_id: str = Field(
@@ -278,6 +330,12 @@ class AgentOutput(BaseModel):
         }
     }
 
+    @field_validator("agent_id")
+    @classmethod
+    def validate_agent_id(cls, v: str) -> str:
+        """Validate agent_id format and intern it."""
+        return _check_agent_id(v)
+
     @field_validator("task_id")
     @classmethod
     def validate_task_id_uuid(cls, v: str) -> str:
@@ -328,7 +386,7 @@ class AgentContext(BaseModel):
 
     Context Handoff Helpers:
         - add_output(output): Append output to previous_outputs
-        - add_feedback(feedback): Append feedback to cumulative_feedback
+        - add_feedback(*feedback): Append feedback to cumulative_feedback
         - get_latest_output(): Retrieve most recent agent output
 
     Example:
@@ -374,11 +432,9 @@ class AgentContext(BaseModel):
     @field_validator("spec_path", "plan_path")
     @classmethod
     def validate_file_paths_exist(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that file paths exist if provided."""
+        """Validate that file paths exist if provided (cached per path)."""
         if v is not None:
-            path = Path(v)
-            if not path.exists():
-                raise ValueError(f"File path does not exist: {v}")
+            _existing_path(v)
         return v
 
     @model_validator(mode="after")
@@ -399,27 +455,44 @@ class AgentContext(BaseModel):
         """
         Append output to previous_outputs (immutable, returns new context).
 
+        model_copy does not validate, so the chronological ordering the model
+        requires is enforced here: the new output is compared with the latest
+        one (O(1), existing outputs are already ordered). The outputs list is
+        still copied, so each append is O(n).
+
         Args:
             output: AgentOutput to append
 
         Returns:
             New AgentContext with output appended
 
+        Raises:
+            ValueError: If output is older than the latest previous output
+
         Example:
             >>> context = AgentContext()
             >>> output = AgentOutput(...)
             >>> updated = context.add_output(output)
         """
+        previous_outputs = self.previous_outputs
+        if previous_outputs and output.timestamp < previous_outputs[-1].timestamp:
+            raise ValueError(
+                f"previous_outputs not chronologically ordered: "
+                f"{previous_outputs[-1].timestamp} > {output.timestamp}"
+            )
         return self.model_copy(
-            update={"previous_outputs": self.previous_outputs + [output]}
+            update={"previous_outputs": [*previous_outputs, output]}
         )
 
-    def add_feedback(self, feedback: str) -> "AgentContext":
+    def add_feedback(self, *feedback: str) -> "AgentContext":
         """
         Append feedback to cumulative_feedback (immutable, returns new context).
 
+        Accepts several items at once so a verification round's feedback is
+        appended with a single list copy rather than one copy per item.
+
         Args:
-            feedback: Feedback string to append
+            *feedback: One or more feedback strings to append
 
         Returns:
             New AgentContext with feedback appended
@@ -427,9 +500,10 @@ class AgentContext(BaseModel):
         Example:
             >>> context = AgentContext()
             >>> updated = context.add_feedback("Add contract for POST /api/users")
+            >>> updated = updated.add_feedback("Define error codes", "Add rate limits")
         """
         return self.model_copy(
-            update={"cumulative_feedback": self.cumulative_feedback + [feedback]}
+            update={"cumulative_feedback": [*self.cumulative_feedback, *feedback]}
         )
 
     def get_latest_output(self) -> Optional[AgentOutput]:
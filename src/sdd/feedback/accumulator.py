@@ -13,7 +13,12 @@ Constitutional Compliance:
     - Principle IV: Idempotent Operations - Safe to call add() multiple times
 
 Storage:
-    Feedback stored at: .docs/agents/shared/feedback/{task_id}.json
+    Feedback records appended to: .docs/agents/shared/feedback/{task_id}.jsonl
+    (one FeedbackRecord per line) with history metadata (created_at,
+    updated_at, archived) in {task_id}.meta.json. Histories written by
+    earlier releases as {task_id}.json are still read and are migrated on
+    the next add() or archive().
+    Archived histories are moved, unchanged, to the archive directory.
 
 Usage:
     from sdd.feedback.accumulator import FeedbackAccumulator
@@ -36,14 +41,22 @@ Usage:
     print(f"Total feedback items: {len(learnings)}")
 """
 
-import json
 import logging
+import os
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from uuid import UUID
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from sdd.utils import ensure_dir, in_dir, is_uuid, json_dumps, json_loads
+
+try:
+    import fcntl
+except ImportError:  # Optional: no advisory locking on Windows
+    fcntl = None  # type: ignore[assignment]
 
 # Configure structured logging (Principle VII)
 logging.basicConfig(
@@ -52,6 +65,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parsed histories kept per accumulator (least recently used evicted first)
+_HISTORY_CACHE_SIZE = 128
+
+# Bytes read per backward step when tail-reading the last N records
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _history_meta(history: "FeedbackHistory") -> Dict[str, Any]:
+    """Metadata sidecar contents (every field except records) for history."""
+    return {
+        'task_id': history.task_id,
+        'created_at': history.created_at.isoformat(),
+        'updated_at': history.updated_at.isoformat(),
+        'archived': history.archived
+    }
+
+
+@lru_cache(maxsize=1024)
+def _task_files(feedback_dir: Path, task_id: str) -> Tuple[Path, Path, Path]:
+    """(records, metadata, legacy) paths of a task, built once per directory and task."""
+    return (
+        feedback_dir / f"{task_id}.jsonl",
+        feedback_dir / f"{task_id}.meta.json",
+        feedback_dir / f"{task_id}.json"
+    )
+
+
+def _record_line(record: "FeedbackRecord") -> bytes:
+    """One JSONL line for record, serialized straight to bytes by pydantic-core."""
+    return record.__pydantic_serializer__.to_json(record) + b"\n"
+
 
 # ===================================================================
 # FeedbackRecord Model
@@ -151,13 +195,40 @@ class FeedbackHistory(BaseModel):
     @classmethod
     def validate_task_id_uuid(cls, v: str) -> str:
         """Validate that task_id is a valid UUID."""
-        try:
-            UUID(v)
-        except ValueError:
+        if not is_uuid(v):
             raise ValueError(f"task_id must be a valid UUID, got: {v}")
         return v
 
 
+def _detached(history: FeedbackHistory) -> FeedbackHistory:
+    """Shallow copy of a cached history with its own record list (records are frozen)."""
+    return history.model_copy(update={'records': list(history.records)})
+
+
+def _tail_lines(f: BinaryIO, n: int) -> List[bytes]:
+    """
+    Return the last n non-blank lines of a binary file, reading backwards from EOF.
+
+    Only the blocks holding those lines are read, so the cost scales with n
+    rather than with the file size.
+    """
+    pos = f.seek(0, os.SEEK_END)
+    buffer = b""
+    lines: List[bytes] = []
+    while pos > 0:
+        step = min(_TAIL_BLOCK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        buffer = f.read(step) + buffer
+        lines = [line for line in buffer.split(b"\n") if line.strip()]
+        # The first line may be cut at the block boundary unless at offset 0
+        if len(lines) > n:
+            break
+    if pos > 0:
+        lines = lines[1:]
+    return lines[-n:]
+
+
 # ===================================================================
 # FeedbackAccumulator
 # ===================================================================
@@ -193,9 +264,14 @@ class FeedbackAccumulator:
         self.archive_dir = Path(archive_dir)
         self.archive_threshold = archive_threshold
 
+        # task_id -> (file state, parsed history); revalidated by stat() on every read
+        self._history_cache: "OrderedDict[str, Tuple[Tuple[int, ...], FeedbackHistory]]" = (
+            OrderedDict()
+        )
+
         # Create directories
-        self.feedback_dir.mkdir(parents=True, exist_ok=True)
-        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.feedback_dir)
+        ensure_dir(self.archive_dir)
 
         logger.info(
             f"FeedbackAccumulator initialized: dir={self.feedback_dir}, "
@@ -241,35 +317,43 @@ class FeedbackAccumulator:
             1
         """
         # Validate task_id
-        try:
-            UUID(task_id)
-        except ValueError:
+        if not is_uuid(task_id):
             raise ValueError(f"task_id must be valid UUID, got: {task_id}")
 
-        # Load or create history
-        history = self._load_or_create_history(task_id)
+        # One clock read stamps the record and the history update
+        now = datetime.now()
 
-        # Create feedback record
+        # Load or create history metadata (migrating a legacy .json history)
+        meta = self._load_or_create_meta(task_id, now)
+
+        # Create feedback record (validated: this is the API boundary for
+        # caller-supplied values; pydantic-core validation is also faster
+        # here than model_construct)
         record = FeedbackRecord(
             iteration=iteration,
-            timestamp=datetime.now(),
+            timestamp=now,
             feedback=feedback,
             quality_score=quality_score,
             agent_id=agent_id,
             metadata=metadata or {}
         )
 
-        # Add record to history
-        updated_history = FeedbackHistory(
-            task_id=history.task_id,
-            records=history.records + [record],
-            created_at=history.created_at,
-            updated_at=datetime.now(),
-            archived=history.archived
-        )
-
-        # Save updated history
-        self._save_history(updated_history)
+        # Append the record (O(1) write, no rewrite of earlier records)
+        cached = self._history_cache.get(task_id)
+        offset = self._append_record(task_id, record)
+        meta['updated_at'] = now.isoformat()
+        self._save_meta(task_id, meta)
+
+        if cached is not None and cached[0][1] == offset:
+            # Nothing else was appended since the cached parse: extend it in
+            # place (no re-read, no revalidation of earlier records)
+            history = cached[1]
+            history.records.append(record)
+            history.updated_at = now
+            self._cache_history(task_id, self._file_state(task_id), history)
+            updated_history = _detached(history)
+        else:
+            updated_history = self._load_history(task_id)
 
         logger.info(
             f"Added feedback for task_id={task_id}, iteration={iteration}, "
@@ -311,17 +395,18 @@ class FeedbackAccumulator:
             ...     print(f"- {feedback}")
         """
         try:
-            history = self._load_history(task_id)
+            if max_records and max_records > 0 and self._records_file(task_id).exists():
+                # Only the most recent N lines are parsed
+                records: Iterable[FeedbackRecord] = self._iter_records(task_id, last=max_records)
+            else:
+                records = self._load_history(task_id).records
+                if max_records is not None:
+                    records = records[-max_records:]  # Get most recent N records
+            return [record.feedback for record in records]
         except FileNotFoundError:
             logger.info(f"No feedback history found for task_id={task_id}")
             return []
 
-        records = history.records
-        if max_records is not None:
-            records = records[-max_records:]  # Get most recent N records
-
-        return [record.feedback for record in records]
-
     def get_history(self, task_id: str) -> Optional[FeedbackHistory]:
         """
         Get complete feedback history for task.
@@ -373,7 +458,8 @@ class FeedbackAccumulator:
         """
         Archive feedback history for task.
 
-        Moves feedback file to archive directory and marks as archived.
+        Marks the history as archived and moves its files to the archive
+        directory as-is (records are not re-serialized).
 
         Args:
             task_id: Task identifier
@@ -389,34 +475,26 @@ class FeedbackAccumulator:
             >>> if archived:
             ...     print("History archived successfully")
         """
-        feedback_file = self.feedback_dir / f"{task_id}.json"
-        if not feedback_file.exists():
+        if not self._history_exists(task_id):
             logger.warning(f"No feedback history to archive for task_id={task_id}")
             return False
 
-        # Load history
-        history = self._load_history(task_id)
-
-        # Mark as archived
-        archived_history = FeedbackHistory(
-            task_id=history.task_id,
-            records=history.records,
-            created_at=history.created_at,
-            updated_at=datetime.now(),
-            archived=True
-        )
-
-        # Save to archive directory
-        archive_file = self.archive_dir / f"{task_id}.json"
-        archive_file.write_text(archived_history.model_dump_json(indent=2))
-
-        # Delete from active directory
-        feedback_file.unlink()
-
-        logger.info(
-            f"Archived feedback history for task_id={task_id}: "
-            f"{len(history.records)} records"
-        )
+        # Mark as archived (migrating a legacy .json history first)
+        now = datetime.now()
+        meta = self._load_or_create_meta(task_id, now)
+        meta['updated_at'] = now.isoformat()
+        meta['archived'] = True
+        self._save_meta(task_id, meta)
+
+        # Move records and metadata to the archive directory
+        self._history_cache.pop(task_id, None)
+        records_file, meta_file, _ = _task_files(self.feedback_dir, task_id)
+        in_dir(self.archive_dir, lambda: os.replace(
+            records_file, self.archive_dir / records_file.name
+        ))
+        os.replace(meta_file, self.archive_dir / meta_file.name)
+
+        logger.info(f"Archived feedback history for task_id={task_id}")
         return True
 
     def clear(self, task_id: str) -> bool:
@@ -435,39 +513,179 @@ class FeedbackAccumulator:
             ...     task_id="550e8400-e29b-41d4-a716-446655440000"
             ... )
         """
-        feedback_file = self.feedback_dir / f"{task_id}.json"
-        if feedback_file.exists():
-            feedback_file.unlink()
+        self._history_cache.pop(task_id, None)
+        if self._delete_history_files(task_id):
             logger.info(f"Deleted feedback history for task_id={task_id}")
             return True
         return False
 
-    def _load_or_create_history(self, task_id: str) -> FeedbackHistory:
+    def _records_file(self, task_id: str) -> Path:
+        """Append-only JSONL file holding the task's feedback records."""
+        return _task_files(self.feedback_dir, task_id)[0]
+
+    def _meta_file(self, task_id: str) -> Path:
+        """Small JSON file holding the task's history metadata."""
+        return _task_files(self.feedback_dir, task_id)[1]
+
+    def _legacy_file(self, task_id: str) -> Path:
+        """Whole-history JSON file written by earlier releases."""
+        return _task_files(self.feedback_dir, task_id)[2]
+
+    def _history_exists(self, task_id: str) -> bool:
+        """Whether any stored history (JSONL or legacy JSON) exists for task."""
+        return self._records_file(task_id).exists() or self._legacy_file(task_id).exists()
+
+    def _delete_history_files(self, task_id: str) -> bool:
         """
-        Load existing feedback history or create new one.
+        Delete all stored files for task.
+
+        Returns:
+            True if any file was deleted
+        """
+        deleted = False
+        for path in _task_files(self.feedback_dir, task_id):
+            if path.exists():
+                path.unlink()
+                deleted = True
+        return deleted
+
+    def _load_or_create_meta(
+        self,
+        task_id: str,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Load history metadata, creating it for a new task.
+
+        A legacy {task_id}.json history is migrated to JSONL first.
 
         Args:
             task_id: Task identifier
+            now: Creation time for new metadata (default: current time)
 
         Returns:
-            FeedbackHistory (loaded or newly created)
+            Metadata dict (task_id, created_at, updated_at, archived)
         """
+        meta = self._load_meta(task_id)
+        if meta is not None:
+            return meta
+
+        if self._legacy_file(task_id).exists():
+            history = self._load_history(task_id)
+            self._save_history(history)
+            self._legacy_file(task_id).unlink()
+            logger.info(
+                f"Migrated feedback history for task_id={task_id} to JSONL: "
+                f"{len(history.records)} records"
+            )
+            return _history_meta(history)
+
+        if not self._records_file(task_id).exists():
+            logger.info(f"Creating new feedback history for task_id={task_id}")
+        created_at = (now or datetime.now()).isoformat()
+        return {
+            'task_id': task_id, 'created_at': created_at,
+            'updated_at': created_at, 'archived': False
+        }
+
+    def _load_meta(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Load history metadata (None if missing or unreadable)."""
         try:
-            return self._load_history(task_id)
+            meta = json_loads(self._meta_file(task_id).read_bytes())
+        except (OSError, ValueError):
+            return None
+        return meta if isinstance(meta, dict) else None
+
+    def _save_meta(self, task_id: str, meta: Dict[str, Any]) -> None:
+        """Atomically replace history metadata."""
+        meta_file = self._meta_file(task_id)
+        tmp_file = meta_file.with_suffix(".tmp")
+        data = json_dumps(meta)
+        in_dir(self.feedback_dir, lambda: tmp_file.write_bytes(data))
+        os.replace(tmp_file, meta_file)
+
+    def _append_record(self, task_id: str, record: FeedbackRecord) -> int:
+        """
+        Append one record to the task's JSONL file.
+
+        The line is written with a single write under an exclusive advisory
+        lock (where available) and fsync'd, so concurrent agents never
+        interleave records and a crash loses at most the record in flight.
+
+        Returns:
+            File offset the line was written at
+        """
+        line = _record_line(record)
+        records_file = self._records_file(task_id)
+        with in_dir(self.feedback_dir, lambda: open(records_file, "ab")) as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            offset = os.fstat(f.fileno()).st_size
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        return offset
+
+    def _iter_records(self, task_id: str, last: Optional[int] = None) -> Iterator[FeedbackRecord]:
+        """
+        Stream-parse the task's JSONL records (skips a torn trailing line).
+
+        Args:
+            task_id: Task identifier
+            last: Only read and parse the last N records (None = all)
+        """
+        records_file = self._records_file(task_id)
+        with open(records_file, "rb") as f:
+            lines: Iterable[Tuple[int, bytes]]
+            if last is None:
+                lines = enumerate(f, start=1)
+            else:
+                tail = _tail_lines(f, last)
+                lines = zip(range(-len(tail), 0), tail)  # numbered from the end
+            for line_number, line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    yield FeedbackRecord.model_validate_json(line)
+                except ValidationError as e:
+                    logger.warning(
+                        f"Skipping unreadable feedback record {records_file}:{line_number}: {e}"
+                    )
+
+    def _file_state(self, task_id: str) -> Optional[Tuple[int, ...]]:
+        """(mtime_ns, size) of the records and metadata files (None if no records file)."""
+        try:
+            records_stat = self._records_file(task_id).stat()
         except FileNotFoundError:
-            logger.info(f"Creating new feedback history for task_id={task_id}")
-            return FeedbackHistory(
-                task_id=task_id,
-                records=[],
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-                archived=False
-            )
+            return None
+        try:
+            meta_mtime = self._meta_file(task_id).stat().st_mtime_ns
+        except FileNotFoundError:
+            meta_mtime = 0
+        return (records_stat.st_mtime_ns, records_stat.st_size, meta_mtime)
+
+    def _cache_history(
+        self,
+        task_id: str,
+        state: Optional[Tuple[int, ...]],
+        history: FeedbackHistory
+    ) -> None:
+        """Remember a parsed history against the file state it was read at."""
+        if state is None:
+            return
+        self._history_cache[task_id] = (state, history)
+        self._history_cache.move_to_end(task_id)
+        if len(self._history_cache) > _HISTORY_CACHE_SIZE:
+            self._history_cache.popitem(last=False)
 
     def _load_history(self, task_id: str) -> FeedbackHistory:
         """
         Load feedback history from file.
 
+        Parsed histories are cached per task and reused while the files'
+        mtime and size are unchanged, so repeated reads skip validation.
+        Callers receive their own copy of the record list.
+
         Args:
             task_id: Task identifier
 
@@ -477,19 +695,45 @@ class FeedbackAccumulator:
         Raises:
             FileNotFoundError: If history file doesn't exist
         """
-        feedback_file = self.feedback_dir / f"{task_id}.json"
-        if not feedback_file.exists():
-            raise FileNotFoundError(f"Feedback history not found: {feedback_file}")
-
-        return FeedbackHistory.model_validate_json(feedback_file.read_text())
+        # Stat before parsing: a concurrent append makes the entry stale, not wrong
+        state = self._file_state(task_id)
+        if state is None:
+            legacy_file = self._legacy_file(task_id)
+            if not legacy_file.exists():
+                raise FileNotFoundError(
+                    f"Feedback history not found: {self._records_file(task_id)}"
+                )
+            return FeedbackHistory.model_validate_json(legacy_file.read_text())
+
+        cached = self._history_cache.get(task_id)
+        if cached is not None and cached[0] == state:
+            self._history_cache.move_to_end(task_id)
+            history = cached[1]
+        else:
+            records = list(self._iter_records(task_id))
+            meta = self._load_meta(task_id) or {}
+            default_time = records[0].timestamp if records else datetime.now()
+            history = FeedbackHistory(
+                task_id=task_id,
+                records=records,
+                created_at=meta.get('created_at', default_time),
+                updated_at=meta.get('updated_at', default_time),
+                archived=meta.get('archived', False)
+            )
+            self._cache_history(task_id, state, history)
+        return _detached(history)
 
     def _save_history(self, history: FeedbackHistory) -> None:
         """
-        Save feedback history to file.
+        Save feedback history to file (full rewrite of records and metadata).
 
         Args:
             history: FeedbackHistory to save
         """
-        feedback_file = self.feedback_dir / f"{history.task_id}.json"
-        feedback_file.write_text(history.model_dump_json(indent=2))
-        logger.debug(f"Saved feedback history: {feedback_file}")
+        records_file = self._records_file(history.task_id)
+        tmp_file = records_file.with_suffix(".jsonl.tmp")
+        data = b"".join(_record_line(record) for record in history.records)
+        in_dir(self.feedback_dir, lambda: tmp_file.write_bytes(data))
+        os.replace(tmp_file, records_file)
+        self._save_meta(history.task_id, _history_meta(history))
+        logger.debug(f"Saved feedback history: {records_file}")
@@ -5,8 +5,17 @@ DS-STAR Multi-Agent Enhancement - Feature 001
 Contains performance metrics and KPI tracking.
 """
 
-from .models import TaskMetrics
+from typing import Any
 
 __all__ = [
     "TaskMetrics",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the pydantic models on first use so that importing
+    # sdd.metrics.collector alone stays cheap
+    if name == "TaskMetrics":
+        from .models import TaskMetrics
+        return TaskMetrics
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
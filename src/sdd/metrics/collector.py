@@ -22,6 +22,9 @@ Metrics Tracked:
 Storage:
     Metrics stored at: .docs/agents/shared/metrics/{phase}/{task_id}.json
     Baseline stored at: .docs/agents/shared/metrics/baseline.json
+    One JSON file per task is the interchange format (TaskMetrics.load_from_file,
+    agents reading .docs/); scans re-parse only files that are new or changed
+    since the collector last read them.
 
 Usage:
     from sdd.metrics.collector import MetricsCollector
@@ -48,11 +51,17 @@ Usage:
 
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
-from sdd.metrics.models import TaskMetrics
+from sdd.utils import ensure_dir, json_dumps, json_loads
+
+# TaskMetrics (and with it pydantic) is imported where it is first needed, so
+# constructing a collector or setting a baseline does not load the model layer
+if TYPE_CHECKING:
+    from sdd.metrics.models import TaskMetrics
 
 # Configure structured logging (Principle VII)
 logging.basicConfig(
@@ -62,6 +71,60 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class _MetricsTotals(NamedTuple):
+    """Sums and counts behind the aggregate metrics of a group of tasks."""
+
+    task_count: int = 0
+    completed: int = 0
+    refinement_rounds: int = 0
+    debug_success_total: float = 0.0
+    compliance_total: float = 0.0
+    latency_total: float = 0.0
+    latency_count: int = 0
+
+
+def _fold_metrics(all_metrics: Iterable["TaskMetrics"]) -> _MetricsTotals:
+    """Accumulate every sum and count in one pass over the tasks."""
+    task_count = 0
+    completed = 0
+    refinement_rounds = 0
+    debug_success_total = 0.0
+    compliance_total = 0.0
+    latency_total = 0.0
+    latency_count = 0
+    for m in all_metrics:
+        task_count += 1
+        if m.completed_without_intervention:
+            completed += 1
+        refinement_rounds += m.refinement_rounds
+        debug_success_total += m.calculate_debug_success_rate()
+        compliance_total += m.calculate_constitutional_compliance_rate()
+        if m.avg_context_latency_ms > 0:
+            latency_total += m.avg_context_latency_ms
+            latency_count += 1
+    return _MetricsTotals(
+        task_count, completed, refinement_rounds, debug_success_total,
+        compliance_total, latency_total, latency_count
+    )
+
+
+def _merge_totals(totals: Iterable[_MetricsTotals]) -> _MetricsTotals:
+    """Field-wise sum of several groups' totals."""
+    return _MetricsTotals(*(sum(fields) for fields in zip(_MetricsTotals(), *totals)))
+
+
+class _LazyJSON:
+    """Log argument that is JSON-encoded only when a handler formats the record."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+
+    def __str__(self) -> str:
+        return json.dumps(self.data)
+
+
 # ===================================================================
 # Baseline Metrics Model
 # ===================================================================
@@ -150,8 +213,11 @@ class MetricsCollector:
         self.metrics_dir = Path(metrics_dir)
         self.baseline_file = Path(baseline_file)
 
+        # Metrics file path -> ((mtime_ns, size), parsed TaskMetrics); TaskMetrics is frozen
+        self._metrics_cache: Dict[str, Tuple[Tuple[int, int], "TaskMetrics"]] = {}
+
         # Create directories
-        self.metrics_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.metrics_dir)
 
         # Load or create baseline
         self.baseline = self._load_baseline()
@@ -161,7 +227,7 @@ class MetricsCollector:
             f"task_count={self.baseline.task_count}"
         )
 
-    def record_task(self, metrics: TaskMetrics) -> None:
+    def record_task(self, metrics: "TaskMetrics") -> None:
         """
         Record task metrics.
 
@@ -179,7 +245,8 @@ class MetricsCollector:
             >>> collector.record_task(metrics)
         """
         # Save metrics to file
-        metrics.save_to_file(str(self.metrics_dir))
+        metrics_file = metrics.save_to_file(str(self.metrics_dir))
+        self._cache_metrics_file(metrics_file, metrics)
 
         logger.info(
             f"Recorded metrics: task_id={metrics.task_id}, phase={metrics.phase}, "
@@ -189,6 +256,30 @@ class MetricsCollector:
         # Log structured metrics (Principle VII)
         self._log_structured_metrics(metrics)
 
+    def record_tasks(self, metrics_list: List["TaskMetrics"]) -> None:
+        """
+        Record metrics for many tasks.
+
+        Equivalent to calling record_task() for each item, with a single
+        summary log line instead of one per task.
+
+        Args:
+            metrics_list: TaskMetrics instances to record
+
+        Example:
+            >>> collector = MetricsCollector()
+            >>> collector.record_tasks([planning_metrics, validation_metrics])
+        """
+        base_path = str(self.metrics_dir)
+        for metrics in metrics_list:
+            metrics_file = metrics.save_to_file(base_path)
+            self._cache_metrics_file(metrics_file, metrics)
+
+            # Log structured metrics (Principle VII)
+            self._log_structured_metrics(metrics)
+
+        logger.info(f"Recorded metrics for {len(metrics_list)} tasks")
+
     def calculate_improvement(
         self,
         phase: Optional[str] = None,
@@ -205,7 +296,8 @@ class MetricsCollector:
             since: Filter to metrics since timestamp (None = all time)
 
         Returns:
-            Improvement ratio (current / baseline)
+            Improvement ratio (current / baseline); 0.0 when no baseline is set
+            (matching get_aggregate_metrics' improvement_ratio)
 
         Example:
             >>> collector = MetricsCollector()
@@ -215,6 +307,11 @@ class MetricsCollector:
             >>> else:
             ...     print(f"Current: {improvement:.2f}x, Target: 3.5x")
         """
+        # Without a baseline there is no ratio: skip scanning metrics
+        if self.baseline.task_completion_accuracy <= 0:
+            logger.warning("No baseline set (see set_baseline); improvement is 0.0")
+            return 0.0
+
         # Load all task metrics
         all_metrics = self._load_all_metrics(phase=phase, since=since)
 
@@ -223,14 +320,11 @@ class MetricsCollector:
             return 0.0
 
         # Calculate current task completion accuracy
+        from sdd.metrics.models import TaskMetrics
         current_accuracy = TaskMetrics.calculate_task_completion_accuracy(all_metrics)
 
         # Calculate improvement ratio
-        if self.baseline.task_completion_accuracy > 0:
-            improvement = current_accuracy / self.baseline.task_completion_accuracy
-        else:
-            # No baseline or zero baseline - treat current as improvement
-            improvement = float('inf') if current_accuracy > 0 else 0.0
+        improvement = current_accuracy / self.baseline.task_completion_accuracy
 
         logger.info(
             f"Improvement calculation: current={current_accuracy:.1f}%, "
@@ -260,9 +354,16 @@ class MetricsCollector:
             >>> agg = collector.get_aggregate_metrics(phase="planning")
             >>> print(f"Avg refinement rounds: {agg['avg_refinement_rounds']:.1f}")
         """
-        all_metrics = self._load_all_metrics(phase=phase, since=since)
+        return self._aggregate(self._load_all_metrics(phase=phase, since=since))
 
-        if not all_metrics:
+    def _aggregate(self, all_metrics: List["TaskMetrics"]) -> Dict[str, Any]:
+        """Aggregate metrics for a list of tasks (see get_aggregate_metrics)."""
+        return self._summarize(_fold_metrics(all_metrics))
+
+    def _summarize(self, totals: "_MetricsTotals") -> Dict[str, Any]:
+        """Turn folded sums and counts into the aggregate metrics dict."""
+        task_count = totals.task_count
+        if not task_count:
             return {
                 'task_count': 0,
                 'task_completion_accuracy': 0.0,
@@ -273,19 +374,13 @@ class MetricsCollector:
                 'improvement_ratio': 0.0
             }
 
-        # Calculate aggregates
-        task_completion_accuracy = TaskMetrics.calculate_task_completion_accuracy(all_metrics)
-
-        avg_refinement_rounds = sum(m.refinement_rounds for m in all_metrics) / len(all_metrics)
-
-        debug_success_rates = [m.calculate_debug_success_rate() for m in all_metrics]
-        avg_debug_success_rate = sum(debug_success_rates) / len(debug_success_rates)
-
-        compliance_rates = [m.calculate_constitutional_compliance_rate() for m in all_metrics]
-        avg_compliance_rate = sum(compliance_rates) / len(compliance_rates)
-
-        latencies = [m.avg_context_latency_ms for m in all_metrics if m.avg_context_latency_ms > 0]
-        avg_context_latency = sum(latencies) / len(latencies) if latencies else 0.0
+        task_completion_accuracy = (totals.completed / task_count) * 100.0
+        avg_refinement_rounds = totals.refinement_rounds / task_count
+        avg_debug_success_rate = totals.debug_success_total / task_count
+        avg_compliance_rate = totals.compliance_total / task_count
+        avg_context_latency = (
+            totals.latency_total / totals.latency_count if totals.latency_count else 0.0
+        )
 
         improvement_ratio = (
             task_completion_accuracy / self.baseline.task_completion_accuracy
@@ -293,7 +388,7 @@ class MetricsCollector:
         )
 
         return {
-            'task_count': len(all_metrics),
+            'task_count': task_count,
             'task_completion_accuracy': task_completion_accuracy,
             'avg_refinement_rounds': avg_refinement_rounds,
             'avg_debug_success_rate': avg_debug_success_rate,
@@ -305,13 +400,15 @@ class MetricsCollector:
 
     def export_metrics_report(
         self,
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        pretty: bool = False
     ) -> str:
         """
         Export comprehensive metrics report.
 
         Args:
             output_path: Path to save report (default: metrics_dir/report_{timestamp}.json)
+            pretty: Indent the JSON for reading (default: compact)
 
         Returns:
             Path to exported report
@@ -325,32 +422,51 @@ class MetricsCollector:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = str(self.metrics_dir / f"report_{timestamp}.json")
 
-        # Gather all metrics
+        # Gather all metrics (one scan) and fold each task once into its
+        # phase totals; the overall aggregate merges the phase totals
         all_metrics = self._load_all_metrics()
+        metrics_by_phase: Dict[str, List["TaskMetrics"]] = {}
+        for metrics in all_metrics:
+            metrics_by_phase.setdefault(metrics.phase, []).append(metrics)
+        totals_by_phase = {
+            phase: _fold_metrics(phase_metrics)
+            for phase, phase_metrics in metrics_by_phase.items()
+        }
 
-        # Build report
-        report = {
+        # Build report header (everything but the per-task entries)
+        header: Dict[str, Any] = {
             'generated_at': datetime.now().isoformat(),
             'baseline': self.baseline.to_dict(),
-            'aggregate': self.get_aggregate_metrics(),
-            'by_phase': {},
-            'tasks': []
+            'aggregate': self._summarize(_merge_totals(totals_by_phase.values())),
+            'by_phase': {}
         }
 
         # Aggregate by phase
         for phase in ['specification', 'planning', 'implementation', 'validation']:
-            phase_metrics = self.get_aggregate_metrics(phase=phase)
-            if phase_metrics['task_count'] > 0:
-                report['by_phase'][phase] = phase_metrics
+            if phase in totals_by_phase:
+                header['by_phase'][phase] = self._summarize(totals_by_phase[phase])
 
-        # Individual task metrics
-        for metrics in all_metrics:
-            report['tasks'].append(metrics.export_for_analysis())
-
-        # Save report
+        # Save report, streaming individual task metrics one entry at a time
+        # (same layout as json.dumps(report), without building it)
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(json.dumps(report, indent=2))
+        with open(output_file, 'w') as f:
+            if pretty:
+                f.write(json.dumps(header, indent=2)[:-2])  # Drop the closing "\n}"
+                f.write(',\n  "tasks": [')
+                for i, metrics in enumerate(all_metrics):
+                    entry = json.dumps(metrics.export_for_analysis(), indent=2)
+                    f.write(',\n    ' if i else '\n    ')
+                    f.write(entry.replace('\n', '\n    '))
+                f.write('\n  ]\n}' if all_metrics else ']\n}')
+            else:
+                f.write(json.dumps(header, separators=(',', ':'))[:-1])  # Drop the closing "}"
+                f.write(',"tasks":[')
+                for i, metrics in enumerate(all_metrics):
+                    if i:
+                        f.write(',')
+                    f.write(json.dumps(metrics.export_for_analysis(), separators=(',', ':')))
+                f.write(']}')
 
         logger.info(f"Metrics report exported: {output_path}")
         return str(output_file)
@@ -404,14 +520,12 @@ class MetricsCollector:
 
     def _load_baseline(self) -> BaselineMetrics:
         """Load baseline metrics from file."""
-        if not self.baseline_file.exists():
-            logger.info("No baseline found. Creating default (0.0).")
-            return BaselineMetrics()
-
         try:
-            with open(self.baseline_file, 'r') as f:
-                data = json.load(f)
+            data = json_loads(self.baseline_file.read_bytes())
             return BaselineMetrics.from_dict(data)
+        except FileNotFoundError:
+            logger.info("No baseline found. Creating default (0.0).")
+            return BaselineMetrics()
         except Exception as e:
             logger.warning(f"Failed to load baseline: {e}. Using default.")
             return BaselineMetrics()
@@ -419,35 +533,54 @@ class MetricsCollector:
     def _save_baseline(self) -> None:
         """Save baseline metrics to file."""
         self.baseline_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.baseline_file, 'w') as f:
-            json.dump(self.baseline.to_dict(), f, indent=2)
+        self.baseline_file.write_bytes(json_dumps(self.baseline.to_dict()))
         logger.info(f"Baseline saved: {self.baseline_file}")
 
     def _load_all_metrics(
         self,
         phase: Optional[str] = None,
         since: Optional[datetime] = None
-    ) -> List[TaskMetrics]:
-        """Load all task metrics from storage."""
+    ) -> List["TaskMetrics"]:
+        """
+        Load all task metrics from storage.
+
+        Directories are listed with os.scandir (no Path object per entry).
+        Files are only parsed when new or changed since the previous scan;
+        unchanged ones reuse their cached TaskMetrics.
+        """
         all_metrics = []
+        seen = set()
 
         # Determine which phase directories to scan
+        root = str(self.metrics_dir)
         if phase:
-            phase_dirs = [self.metrics_dir / phase]
+            phase_dirs = [os.path.join(root, phase)]
         else:
-            phase_dirs = [
-                d for d in self.metrics_dir.iterdir()
-                if d.is_dir() and d.name != 'archive'
-            ]
+            try:
+                with os.scandir(root) as entries:
+                    phase_dirs = [
+                        entry.path for entry in entries
+                        if entry.is_dir() and entry.name != 'archive'
+                    ]
+            except FileNotFoundError:
+                # Metrics directory removed since construction: nothing recorded
+                phase_dirs = []
 
         # Load metrics from each phase directory
         for phase_dir in phase_dirs:
-            if not phase_dir.exists():
+            try:
+                with os.scandir(phase_dir) as entries:
+                    metrics_files = [
+                        entry.path for entry in entries
+                        if entry.name.endswith('.json') and entry.is_file()
+                    ]
+            except (FileNotFoundError, NotADirectoryError):
                 continue
 
-            for metrics_file in phase_dir.glob("*.json"):
+            for metrics_file in metrics_files:
+                seen.add(metrics_file)
                 try:
-                    metrics = TaskMetrics.model_validate_json(metrics_file.read_text())
+                    metrics = self._load_metrics_file(metrics_file)
 
                     # Filter by timestamp if requested
                     if since and metrics.started_at < since:
@@ -457,10 +590,37 @@ class MetricsCollector:
                 except Exception as e:
                     logger.warning(f"Failed to load metrics from {metrics_file}: {e}")
 
+        # A full scan knows every live file: forget deleted ones
+        if not phase:
+            for stale_file in self._metrics_cache.keys() - seen:
+                del self._metrics_cache[stale_file]
+
         return all_metrics
 
-    def _log_structured_metrics(self, metrics: TaskMetrics) -> None:
+    def _load_metrics_file(self, metrics_file: str) -> "TaskMetrics":
+        """Parse a metrics file (cached while its mtime and size are unchanged)."""
+        stat = os.stat(metrics_file)
+        state = (stat.st_mtime_ns, stat.st_size)
+        cached = self._metrics_cache.get(metrics_file)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+        from sdd.metrics.models import TaskMetrics
+        with open(metrics_file, 'rb') as f:
+            metrics = TaskMetrics.model_validate_json(f.read())
+        self._metrics_cache[metrics_file] = (state, metrics)
+        return metrics
+
+    def _cache_metrics_file(self, metrics_file: Path, metrics: "TaskMetrics") -> None:
+        """Seed the parse cache with metrics just written (no re-parse on next scan)."""
+        stat = metrics_file.stat()
+        self._metrics_cache[str(metrics_file)] = ((stat.st_mtime_ns, stat.st_size), metrics)
+
+    def _log_structured_metrics(self, metrics: "TaskMetrics") -> None:
         """Log structured metrics (Principle VII)."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         log_data = {
             'timestamp': datetime.now().isoformat(),
             'level': 'INFO',
@@ -475,4 +635,4 @@ class MetricsCollector:
             'escalated_to_human': metrics.escalated_to_human
         }
 
-        logger.info(f"STRUCTURED_METRICS: {json.dumps(log_data)}")
+        logger.info("STRUCTURED_METRICS: %s", _LazyJSON(log_data))
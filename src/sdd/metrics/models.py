@@ -45,10 +45,52 @@ Usage:
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Annotated, Any, Iterable, List, Optional, Tuple
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from sdd.utils import ensure_dir, in_dir, is_uuid
+
+
+# Score in [0.0, 1.0], range-checked per element by pydantic-core
+_Score = Annotated[float, Field(ge=0.0, le=1.0)]
+
+
+def _import_pyarrow() -> Tuple[Any, Any]:
+    """Import pyarrow and its Parquet module (optional: batch Parquet format)."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet metrics require pyarrow (pip install 'sdd-agentic-framework[perf]')"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def _parquet_schema(pa: Any) -> Any:
+    """Arrow schema with one column per TaskMetrics field."""
+    return pa.schema([
+        ("task_id", pa.string()),
+        ("phase", pa.string()),
+        ("started_at", pa.timestamp("us")),
+        ("completed_at", pa.timestamp("us")),
+        ("duration_seconds", pa.float64()),
+        ("refinement_rounds", pa.int64()),
+        ("refinement_quality_scores", pa.list_(pa.float64())),
+        ("early_stopped", pa.bool_()),
+        ("errors_encountered", pa.int64()),
+        ("errors_auto_resolved", pa.int64()),
+        ("debug_iterations", pa.list_(pa.int64())),
+        ("context_queries", pa.int64()),
+        ("avg_context_latency_ms", pa.float64()),
+        ("context_relevance_scores", pa.list_(pa.float64())),
+        ("verification_checks", pa.int64()),
+        ("verification_passes_first_time", pa.int64()),
+        ("completed_without_intervention", pa.bool_()),
+        ("escalated_to_human", pa.bool_()),
+    ])
+
 
 # ===================================================================
 # TaskMetrics (T027)
@@ -154,7 +196,7 @@ class TaskMetrics(BaseModel):
         description="Number of refinement iterations"
     )
 
-    refinement_quality_scores: List[float] = Field(
+    refinement_quality_scores: List[_Score] = Field(
         default_factory=list,
         description="Quality score per iteration (0.0 to 1.0)"
     )
@@ -193,7 +235,7 @@ class TaskMetrics(BaseModel):
         description="Average context query latency in milliseconds"
     )
 
-    context_relevance_scores: List[float] = Field(
+    context_relevance_scores: List[_Score] = Field(
         default_factory=list,
         description="Relevance per query (0.0 to 1.0)"
     )
@@ -222,6 +264,7 @@ class TaskMetrics(BaseModel):
 
     model_config = {
         "frozen": True,  # Immutable after creation (audit trail)
+        "defer_build": True,  # Core schema built on first use, not at import
         "json_schema_extra": {
             "examples": [
                 {
@@ -252,42 +295,26 @@ class TaskMetrics(BaseModel):
     @classmethod
     def validate_task_id_uuid(cls, v: str) -> str:
         """Validate that task_id is a valid UUID."""
-        from uuid import UUID
-        try:
-            UUID(v)
-        except ValueError:
+        if not is_uuid(v):
             raise ValueError(f"task_id must be a valid UUID, got: {v}")
         return v
 
-    @field_validator("refinement_quality_scores", "context_relevance_scores")
-    @classmethod
-    def validate_score_ranges(cls, v: List[float]) -> List[float]:
-        """Validate that all scores are between 0.0 and 1.0."""
-        for score in v:
-            if not 0.0 <= score <= 1.0:
-                raise ValueError(f"Score must be between 0.0 and 1.0, got: {score}")
-        return v
-
     @model_validator(mode="after")
-    def validate_completed_requires_duration(self) -> "TaskMetrics":
-        """Validate that duration_seconds is set if completed_at is set."""
+    def validate_cross_field_constraints(self) -> "TaskMetrics":
+        """
+        Validate cross-field constraints in one pass.
+
+        - duration_seconds must be set if completed_at is set
+        - errors_auto_resolved <= errors_encountered
+        - verification_passes_first_time <= verification_checks
+        """
         if self.completed_at is not None and self.duration_seconds is None:
             raise ValueError("duration_seconds must be set if completed_at is set")
-        return self
-
-    @model_validator(mode="after")
-    def validate_errors_auto_resolved_within_encountered(self) -> "TaskMetrics":
-        """Validate that errors_auto_resolved <= errors_encountered."""
         if self.errors_auto_resolved > self.errors_encountered:
             raise ValueError(
                 f"errors_auto_resolved ({self.errors_auto_resolved}) cannot exceed "
                 f"errors_encountered ({self.errors_encountered})"
             )
-        return self
-
-    @model_validator(mode="after")
-    def validate_verification_passes_within_checks(self) -> "TaskMetrics":
-        """Validate that verification_passes_first_time <= verification_checks."""
         if self.verification_passes_first_time > self.verification_checks:
             raise ValueError(
                 f"verification_passes_first_time ({self.verification_passes_first_time}) "
@@ -339,9 +366,10 @@ class TaskMetrics(BaseModel):
             >>> metrics.calculate_avg_refinement_quality()
             0.8
         """
-        if not self.refinement_quality_scores:
+        scores = self.refinement_quality_scores
+        if not scores:
             return 0.0
-        return sum(self.refinement_quality_scores) / len(self.refinement_quality_scores)
+        return sum(scores) / len(scores)
 
     def calculate_avg_context_relevance(self) -> float:
         """
@@ -355,9 +383,10 @@ class TaskMetrics(BaseModel):
             >>> metrics.calculate_avg_context_relevance()
             0.9
         """
-        if not self.context_relevance_scores:
+        scores = self.context_relevance_scores
+        if not scores:
             return 0.0
-        return sum(self.context_relevance_scores) / len(self.context_relevance_scores)
+        return sum(scores) / len(scores)
 
     @staticmethod
     def calculate_task_completion_accuracy(metrics_list: List["TaskMetrics"]) -> float:
@@ -420,10 +449,11 @@ class TaskMetrics(BaseModel):
             >>> print(f"Saved to {saved_path}")
         """
         metrics_dir = Path(base_path) / self.phase
-        metrics_dir.mkdir(parents=True, exist_ok=True)
-
+        ensure_dir(metrics_dir)
         metrics_file = metrics_dir / f"{self.task_id}.json"
-        metrics_file.write_text(self.model_dump_json(indent=2))
+        # Serialized straight to UTF-8 bytes by pydantic-core (no str round trip)
+        data = self.__pydantic_serializer__.to_json(self, indent=2)
+        in_dir(metrics_dir, lambda: metrics_file.write_bytes(data))
 
         return metrics_file
 
@@ -448,15 +478,87 @@ class TaskMetrics(BaseModel):
             >>> print(f"Duration: {metrics.duration_seconds}s")
         """
         metrics_file = Path(base_path) / phase / f"{task_id}.json"
-        if not metrics_file.exists():
-            raise FileNotFoundError(f"Metrics file not found: {metrics_file}")
+        try:
+            data = metrics_file.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Metrics file not found: {metrics_file}") from None
 
-        return cls.model_validate_json(metrics_file.read_text())
+        # Validated even though save_to_file wrote it: pydantic-core parses and
+        # validates the bytes faster than orjson.loads + model_construct
+        return cls.model_validate_json(data)
+
+    @staticmethod
+    def save_many(metrics_list: List["TaskMetrics"], path: str) -> Path:
+        """
+        Save many tasks' metrics to one Parquet file (one row per task).
+
+        Columnar batch format for analysis tools; the per-task JSON files
+        written by save_to_file remain the primary storage. Timestamps are
+        stored without timezone. Requires the optional pyarrow package.
+
+        Args:
+            metrics_list: TaskMetrics to save
+            path: Parquet file to write
+
+        Returns:
+            Path to saved file
+
+        Example:
+            >>> TaskMetrics.save_many(metrics_list, "metrics/planning.parquet")
+        """
+        pa, pq = _import_pyarrow()
+        table = pa.Table.from_pylist(
+            [metrics.model_dump() for metrics in metrics_list],
+            schema=_parquet_schema(pa)
+        )
+
+        metrics_file = Path(path)
+        metrics_file.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, metrics_file, compression="zstd")
+
+        return metrics_file
+
+    @classmethod
+    def load_many(
+        cls,
+        path: str,
+        phase: Optional[str] = None,
+        task_ids: Optional[Iterable[str]] = None
+    ) -> List["TaskMetrics"]:
+        """
+        Load metrics saved by save_many.
+
+        Filters are pushed down to the Parquet reader, so row groups that
+        cannot match are skipped. Requires the optional pyarrow package.
+
+        Args:
+            path: Parquet file written by save_many
+            phase: Only load tasks in this phase (None = all)
+            task_ids: Only load these tasks (None = all)
+
+        Returns:
+            List of TaskMetrics
+
+        Example:
+            >>> planning = TaskMetrics.load_many("metrics/all.parquet", phase="planning")
+        """
+        _, pq = _import_pyarrow()
+        filters: List[Tuple[str, str, Any]] = []
+        if phase is not None:
+            filters.append(("phase", "=", phase))
+        if task_ids is not None:
+            filters.append(("task_id", "in", list(task_ids)))
+
+        table = pq.read_table(path, filters=filters or None)
+        return [cls.model_validate(row) for row in table.to_pylist()]
 
     def export_for_analysis(self) -> dict:
         """
         Export metrics in format optimized for analysis.
 
+        Timestamps are POSIX epoch seconds (naive datetimes are taken as
+        local time) so they load as numeric columns without date parsing.
+
         Returns:
             Dictionary with flattened metrics structure
 
@@ -466,17 +568,20 @@ class TaskMetrics(BaseModel):
             >>> import json
             >>> print(json.dumps(export, indent=2))
         """
+        debug_iterations = self.debug_iterations
+        completed_at = self.completed_at
         return {
             "task_id": self.task_id,
             "phase": self.phase,
+            "started_at_epoch": self.started_at.timestamp(),
+            "completed_at_epoch": completed_at.timestamp() if completed_at else None,
             "duration_seconds": self.duration_seconds,
             "refinement_rounds": self.refinement_rounds,
             "avg_refinement_quality": self.calculate_avg_refinement_quality(),
             "early_stopped": self.early_stopped,
             "debug_success_rate": self.calculate_debug_success_rate(),
             "avg_debug_iterations": (
-                sum(self.debug_iterations) / len(self.debug_iterations)
-                if self.debug_iterations else 0.0
+                sum(debug_iterations) / len(debug_iterations) if debug_iterations else 0.0
             ),
             "context_queries": self.context_queries,
             "avg_context_latency_ms": self.avg_context_latency_ms,
@@ -17,6 +17,7 @@ Configuration:
     Loads settings from .specify/config/refinement.conf:
     - MAX_REFINEMENT_ROUNDS (default: 20)
     - EARLY_STOP_THRESHOLD (default: 0.95)
+    - MAX_PARALLEL_AGENTS (default: 3, concurrent loops in refine_many_until_sufficient)
     - Quality thresholds per phase
 
 Usage:
@@ -40,17 +41,21 @@ Usage:
         print("Max rounds reached - escalating to human")
 """
 
+import hashlib
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sdd.agents.quality.models import VerificationDecision
 from sdd.agents.quality.verifier import VerificationAgent
 from sdd.agents.shared.models import AgentContext, AgentInput
 from sdd.refinement.models import IterationRecord, RefinementState
+from sdd.utils import parse_config
 
 # Configure structured logging (Principle VII)
 logging.basicConfig(
@@ -59,6 +64,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Phase -> (config key, default) for the quality threshold of that phase
+_PHASE_KEYS: Dict[str, Tuple[str, float]] = {
+    "specification": ("SPEC_COMPLETENESS_THRESHOLD", 0.90),
+    "planning": ("PLAN_QUALITY_THRESHOLD", 0.85),
+    "implementation": ("CODE_QUALITY_THRESHOLD", 0.80),
+    "validation": ("TEST_COVERAGE_THRESHOLD", 0.80),
+}
+
+# Threshold for phases not listed in _PHASE_KEYS
+_DEFAULT_QUALITY_THRESHOLD = 0.85
+
+# State is fsync'd every N rounds and on the round that ends the loop. A power
+# loss in between can drop unsynced log appends while the header survives;
+# RefinementState.load_from_file then replays the rounds the log kept, so the
+# resumed loop re-runs the lost ones
+_FSYNC_EVERY_N_ROUNDS = 4
+
+
+def _artifact_key(*paths: Optional[str]) -> bytes:
+    """
+    BLAKE2b digest over the contents of the files a verification reads.
+
+    Missing or unset paths hash to a fixed marker, so a spec appearing or
+    disappearing also changes the key.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        try:
+            data = Path(path).read_bytes() if path else None
+        except FileNotFoundError:
+            data = None
+        if data is None:
+            digest.update(b"\xff" * 8)
+        else:
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+    return digest.digest()
+
 
 class RefinementEngine:
     """
@@ -73,6 +116,7 @@ class RefinementEngine:
         config: Loaded configuration dictionary
         max_rounds: Maximum refinement iterations (from config)
         early_stop_threshold: Quality score for early stopping (from config)
+        max_parallel: Concurrent refinement loops for refine_many_until_sufficient
     """
 
     def __init__(
@@ -95,6 +139,11 @@ class RefinementEngine:
         self.config = self._load_config()
         self.max_rounds = int(self.config.get("MAX_REFINEMENT_ROUNDS", 20))
         self.early_stop_threshold = float(self.config.get("EARLY_STOP_THRESHOLD", 0.95))
+        self.max_parallel = int(self.config.get("MAX_PARALLEL_AGENTS", 3))
+        self._phase_thresholds = {
+            phase: float(self.config.get(key, default))
+            for phase, (key, default) in _PHASE_KEYS.items()
+        }
 
         logger.info(
             f"RefinementEngine initialized: max_rounds={self.max_rounds}, "
@@ -105,29 +154,23 @@ class RefinementEngine:
         """
         Load configuration from refinement.conf.
 
+        The file is parsed once per modification time and shared by engines
+        or retrievers using the same path (see sdd.utils.parse_config).
+
         Returns:
             Dictionary of configuration key-value pairs
 
         Raises:
             FileNotFoundError: If config file doesn't exist
         """
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-
-        config = {}
-        with open(self.config_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                # Parse key=value pairs
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    config[key.strip()] = value.strip().strip('"')
-
-        logger.info(f"Loaded config from {self.config_path}: {len(config)} settings")
-        return config
+        try:
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration file not found: {self.config_path}"
+            ) from None
+
+        return dict(parse_config(str(self.config_path), mtime_ns))
 
     def _get_quality_threshold(self, phase: str) -> float:
         """
@@ -139,13 +182,7 @@ class RefinementEngine:
         Returns:
             Quality threshold for phase (0.0-1.0)
         """
-        phase_thresholds = {
-            "specification": float(self.config.get("SPEC_COMPLETENESS_THRESHOLD", 0.90)),
-            "planning": float(self.config.get("PLAN_QUALITY_THRESHOLD", 0.85)),
-            "implementation": float(self.config.get("CODE_QUALITY_THRESHOLD", 0.80)),
-            "validation": float(self.config.get("TEST_COVERAGE_THRESHOLD", 0.80)),
-        }
-        return phase_thresholds.get(phase.lower(), 0.85)
+        return self._phase_thresholds.get(phase.lower(), _DEFAULT_QUALITY_THRESHOLD)
 
     def refine_until_sufficient(
         self,
@@ -164,7 +201,7 @@ class RefinementEngine:
         This is the main refinement loop:
         1. Load or initialize refinement state
         2. For each iteration (up to max_rounds):
-           a. Invoke verification agent
+           a. Invoke verification agent (reused if artifact and spec are unchanged)
            b. Check quality score against threshold
            c. If sufficient: return success
            d. If early stopping: return success
@@ -237,75 +274,100 @@ class RefinementEngine:
             f"current_round={state.current_round}, max_rounds={self.max_rounds}"
         )
 
+        # Verification decisions of this loop by artifact contents. Phase,
+        # thresholds and verifier are fixed for the loop, so unchanged files
+        # (e.g. no refinement_fn) need no repeated verifier call.
+        verified: Dict[bytes, VerificationDecision] = {}
+
         # Refinement loop
         while state.can_continue():
-            iteration_start = time.time()
+            iteration_start = time.monotonic()
             current_round = state.current_round + 1
 
-            logger.info(f"Refinement iteration {current_round}/{self.max_rounds}")
+            logger.info("Refinement iteration %d/%d", current_round, self.max_rounds)
 
             # Capture input state
             input_state = input_state_fn() if input_state_fn else {"round": current_round}
 
-            # Invoke verification agent
-            verification_result = self._verify_artifact(
-                task_id=task_id,
-                phase=phase,
-                artifact_path=artifact_path,
-                verifier=verifier,
-                context=context,
-                quality_threshold=quality_threshold
-            )
+            # Invoke verification agent, unless an earlier round already verified
+            # identical artifact and spec contents
+            artifact_key = _artifact_key(artifact_path, context.spec_path)
+            verification_result = verified.get(artifact_key)
+            if verification_result is None:
+                verification_result = self._verify_artifact(
+                    task_id=task_id,
+                    phase=phase,
+                    artifact_path=artifact_path,
+                    verifier=verifier,
+                    context=context,
+                    quality_threshold=quality_threshold
+                )
+                verified[artifact_key] = verification_result
+                agent_invocations = [verifier.agent_id]
+            else:
+                logger.info("Artifact unchanged since an earlier round, reusing its verification")
+                agent_invocations = []
 
             # Capture output state
             output_state = output_state_fn() if output_state_fn else {"round": current_round}
 
-            # Create iteration record
-            iteration_duration = time.time() - iteration_start
+            # Create iteration record (monotonic duration is immune to clock changes)
+            iteration_duration = time.monotonic() - iteration_start
+            iteration_time = datetime.now()
             iteration = IterationRecord(
                 round=current_round,
-                timestamp=datetime.now(),
+                timestamp=iteration_time,
                 input_state=input_state,
                 output_state=output_state,
                 verification_result=verification_result.model_dump(),
                 quality_score=verification_result.quality_score,
                 duration_seconds=iteration_duration,
-                agent_invocations=[verifier.agent_id]
+                agent_invocations=agent_invocations
             )
 
             # Update state
-            state = state.add_iteration(iteration)
-            state.save_to_file(str(self.state_dir))
+            state = state.add_iteration(iteration, updated_at=iteration_time)
+            state.save_iteration(
+                str(self.state_dir),
+                durable=(
+                    current_round % _FSYNC_EVERY_N_ROUNDS == 0
+                    or current_round >= self.max_rounds
+                    or not state.can_continue()
+                    or state.should_early_stop()
+                )
+            )
 
+            # %-style arguments: formatted only if INFO is enabled
             logger.info(
-                f"Iteration {current_round} complete: "
-                f"quality={verification_result.quality_score:.3f}, "
-                f"ema_quality={state.ema_quality:.3f}, "
-                f"decision={verification_result.decision.value}"
+                "Iteration %d complete: quality=%.3f, ema_quality=%.3f, decision=%s",
+                current_round,
+                verification_result.quality_score,
+                state.ema_quality,
+                verification_result.decision.value
             )
 
             # Check early stopping (exceptional quality)
             if state.should_early_stop():
                 logger.info(
-                    f"Early stopping triggered: ema_quality={state.ema_quality:.3f} >= "
-                    f"threshold={self.early_stop_threshold}"
+                    "Early stopping triggered: ema_quality=%.3f >= threshold=%s",
+                    state.ema_quality, self.early_stop_threshold
                 )
                 return state
 
             # Check quality threshold met
             if state.should_stop() and state.ema_quality >= quality_threshold:
                 logger.info(
-                    f"Quality threshold achieved: ema_quality={state.ema_quality:.3f} >= "
-                    f"threshold={quality_threshold}"
+                    "Quality threshold achieved: ema_quality=%.3f >= threshold=%s",
+                    state.ema_quality, quality_threshold
                 )
                 return state
 
             # Check max rounds reached
             if state.current_round >= self.max_rounds:
                 logger.warning(
-                    f"Max refinement rounds reached ({self.max_rounds}). "
-                    f"Final quality: {state.ema_quality:.3f}, threshold: {quality_threshold}. "
-                    f"Escalating to human."
+                    "Max refinement rounds reached (%d). "
+                    "Final quality: %.3f, threshold: %s. Escalating to human.",
+                    self.max_rounds, state.ema_quality, quality_threshold
                 )
                 self._escalate_to_human(state, artifact_path)
                 return state
@@ -318,6 +380,46 @@ class RefinementEngine:
         # If we exit loop, return final state
         return state
 
+    def refine_many_until_sufficient(
+        self,
+        tasks: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[RefinementState]:
+        """
+        Run independent refinement loops concurrently.
+
+        Each loop blocks mostly on verification and refinement callbacks, so
+        K tasks finish in roughly the time of the slowest one instead of the
+        sum of all of them. Loops share this engine's configuration; each
+        task's state is persisted under its own task_id.
+
+        Args:
+            tasks: Keyword arguments for refine_until_sufficient, one dict per task
+            max_workers: Concurrent loops (default: MAX_PARALLEL_AGENTS from config)
+
+        Returns:
+            Final RefinementState per task, in the order of tasks
+
+        Raises:
+            ValueError: If two tasks share a task_id (they would share state files)
+            Exception: The first error raised by a loop, in task order
+
+        Example:
+            >>> states = engine.refine_many_until_sufficient([
+            ...     {"task_id": spec_id, "phase": "specification",
+            ...      "artifact_path": "spec.md", "verifier": verifier},
+            ...     {"task_id": plan_id, "phase": "planning",
+            ...      "artifact_path": "plan.md", "verifier": verifier},
+            ... ])
+        """
+        task_ids = [task["task_id"] for task in tasks]
+        if len(set(task_ids)) != len(task_ids):
+            raise ValueError("task_id must be unique across concurrent refinement tasks")
+
+        workers = min(max_workers or self.max_parallel, len(tasks)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda task: self.refine_until_sufficient(**task), tasks))
+
     def _load_or_create_state(
         self,
         task_id: str,
@@ -335,12 +437,9 @@ class RefinementEngine:
         Returns:
             RefinementState (loaded or newly created)
         """
-        state_file = self.state_dir / f"{task_id}.json"
-
-        if state_file.exists():
-            logger.info(f"Loading existing refinement state: {state_file}")
-            return RefinementState.load_from_file(task_id, str(self.state_dir))
-        else:
+        try:
+            state = RefinementState.load_from_file(task_id, str(self.state_dir))
+        except FileNotFoundError:
             logger.info(f"Creating new refinement state for task_id={task_id}")
             return RefinementState(
                 task_id=task_id,
@@ -356,6 +455,9 @@ class RefinementEngine:
                 updated_at=datetime.now()
             )
 
+        logger.info(f"Loaded existing refinement state: task_id={task_id}")
+        return state
+
     def _verify_artifact(
         self,
         task_id: str,
@@ -421,7 +523,7 @@ class RefinementEngine:
             state: Final refinement state
             artifact_path: Path to artifact that failed to meet quality
         """
-        escalation_msg = f"""
+        header = f"""
 ================================================================================
 HUMAN ESCALATION REQUIRED
 ================================================================================
@@ -442,27 +544,33 @@ Refinement Summary:
 
 Cumulative Feedback ({len(state.cumulative_feedback)} items):
 """
-        for i, feedback in enumerate(state.cumulative_feedback, 1):
-            escalation_msg += f"\n  {i}. {feedback}"
-
-        escalation_msg += f"""
+        # Collect parts and join once (repeated += copies the message per item)
+        parts = [header]
+        parts.extend(
+            f"\n  {i}. {feedback}"
+            for i, feedback in enumerate(state.cumulative_feedback, 1)
+        )
+        parts.append("""
 
 Iteration History:
-"""
-        for iteration in state.iterations:
-            escalation_msg += f"""
+""")
+        parts.extend(
+            f"""
   Round {iteration.round}:
     Quality: {iteration.quality_score:.3f}
     Duration: {iteration.duration_seconds:.1f}s
     Decision: {iteration.verification_result.get('decision', 'N/A')}
 """
-
-        escalation_msg += """
+            for iteration in state.iterations
+        )
+        parts.append("""
 ================================================================================
 Please review the artifact and accumulated feedback, then manually refine
 or adjust quality thresholds if appropriate.
 ================================================================================
-"""
+""")
+
+        escalation_msg = "".join(parts)
 
         logger.error(escalation_msg)
 
@@ -497,6 +605,8 @@ or adjust quality thresholds if appropriate.
             True if state was deleted, False if didn't exist
         """
         state_file = self.state_dir / f"{task_id}.json"
+        log_file = self.state_dir / f"{task_id}.iterations.jsonl"
+        log_file.unlink(missing_ok=True)
         if state_file.exists():
             state_file.unlink()
             logger.info(f"Deleted refinement state: {state_file}")
@@ -46,11 +46,16 @@ Usage:
     state_path.write_text(state.model_dump_json(indent=2))
 """
 
+import json
+import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+
+logger = logging.getLogger(__name__)
 
 
 # ===================================================================
@@ -224,7 +229,11 @@ class RefinementState(BaseModel):
         3. Terminal states: quality achieved OR max_rounds reached
 
     Storage:
-        Stored in .docs/agents/shared/refinement-state/{task_id}.json
+        Stored in .docs/agents/shared/refinement-state/ as {task_id}.json
+        (every field except iterations) plus {task_id}.iterations.jsonl (one
+        IterationRecord per line, appended as rounds complete). The header is
+        written last, so its current_round marks the committed iterations.
+        Single-file states written by earlier releases are still loaded.
 
     Example:
         >>> from datetime import datetime
@@ -417,12 +426,18 @@ class RefinementState(BaseModel):
         """
         return not self.should_stop()
 
-    def add_iteration(self, iteration: IterationRecord) -> "RefinementState":
+    def add_iteration(
+        self,
+        iteration: IterationRecord,
+        updated_at: datetime | None = None
+    ) -> "RefinementState":
         """
         Add iteration and update state (immutable, returns new state).
 
         Args:
             iteration: IterationRecord to add
+            updated_at: New updated_at (default: now); callers that just took
+                the iteration timestamp can pass it instead of reading the clock again
 
         Returns:
             New RefinementState with iteration added
@@ -449,7 +464,7 @@ class RefinementState(BaseModel):
                 "iterations": self.iterations + [iteration],
                 "cumulative_feedback": new_feedback,
                 "ema_quality": new_ema,
-                "updated_at": datetime.now(),
+                "updated_at": updated_at or datetime.now(),
             }
         )
 
@@ -468,33 +483,104 @@ class RefinementState(BaseModel):
         """
         return self.iterations[-1] if self.iterations else None
 
-    def save_to_file(self, base_path: str = ".docs/agents/shared/refinement-state") -> Path:
+    def save_to_file(
+        self,
+        base_path: str = ".docs/agents/shared/refinement-state",
+        durable: bool = False
+    ) -> Path:
         """
-        Save refinement state to JSON file.
+        Save refinement state to file (full rewrite of log and header).
+
+        Both files are replaced atomically, so readers never see a partial file.
 
         Args:
             base_path: Base directory for state files (default from constitution)
+            durable: fsync the data before returning (survives power loss)
 
         Returns:
-            Path to saved file
+            Path to saved state header file
 
         Example:
             >>> state = RefinementState(...)
-            >>> saved_path = state.save_to_file()
-            >>> print(f"Saved to {saved_path}")
+            >>> path = state.save_to_file()
+            >>> print(f"Saved to: {path}")
         """
         state_dir = Path(base_path)
         state_dir.mkdir(parents=True, exist_ok=True)
 
+        log_file = state_dir / f"{self.task_id}.iterations.jsonl"
+        _replace_file(
+            log_file,
+            b"".join(_iteration_line(record) for record in self.iterations),
+            durable
+        )
+
+        return self._save_header(state_dir, durable)
+
+    def save_iteration(
+        self,
+        base_path: str = ".docs/agents/shared/refinement-state",
+        durable: bool = False
+    ) -> Path:
+        """
+        Persist the latest iteration: append it to the log and rewrite the header.
+
+        Writes O(1) iteration data per round instead of the whole history.
+        Falls back to save_to_file for the first round or when no log exists
+        yet (new task, or a state loaded from a single-file legacy save).
+
+        Args:
+            base_path: Base directory for state files
+            durable: fsync the log and header before returning. One sync also
+                covers rounds appended without it, so callers can sync every
+                few rounds and at the end of a loop.
+
+        Returns:
+            Path to saved state header file
+        """
+        if self.current_round <= 1 or not self.iterations:
+            return self.save_to_file(base_path, durable)
+
+        state_dir = Path(base_path)
+        try:
+            f = open(state_dir / f"{self.task_id}.iterations.jsonl", "r+b")
+        except FileNotFoundError:
+            return self.save_to_file(base_path, durable)
+
+        line = _iteration_line(self.iterations[-1])
+        with f:
+            # Terminate a line torn by a crash so it cannot swallow this record
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+
+        return self._save_header(state_dir, durable)
+
+    def _save_header(self, state_dir: Path, durable: bool = False) -> Path:
+        """Atomically write every field except iterations to {task_id}.json."""
         state_file = state_dir / f"{self.task_id}.json"
-        state_file.write_text(self.model_dump_json(indent=2))
+        _replace_file(
+            state_file,
+            self.__pydantic_serializer__.to_json(self, indent=2, exclude={"iterations"}),
+            durable
+        )
 
         return state_file
 
     @classmethod
     def load_from_file(cls, task_id: str, base_path: str = ".docs/agents/shared/refinement-state") -> "RefinementState":
         """
-        Load refinement state from JSON file.
+        Load refinement state from file.
+
+        If the iteration log lost committed rounds (e.g. an unsynced append
+        dropped by a crash while the header survived), the state is rebuilt
+        by replaying the rounds that remain up to the first gap, so a resumed
+        loop re-runs the lost rounds instead of failing validation.
 
         Args:
             task_id: Task identifier
@@ -503,12 +589,97 @@ class RefinementState(BaseModel):
         Returns:
             RefinementState loaded from file
 
+        Raises:
+            FileNotFoundError: If no state exists for task_id
+
         Example:
             >>> state = RefinementState.load_from_file("550e8400-e29b-41d4-a716-446655440000")
             >>> print(f"Current round: {state.current_round}")
         """
         state_file = Path(base_path) / f"{task_id}.json"
-        if not state_file.exists():
-            raise FileNotFoundError(f"Refinement state not found: {state_file}")
+        try:
+            data = json.loads(state_file.read_bytes())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Refinement state not found: {state_file}") from None
+
+        if "iterations" not in data:
+            log_file = state_file.with_name(f"{task_id}.iterations.jsonl")
+            committed_rounds = data.get("current_round", 0)
+            iterations = _read_iterations(log_file, committed_rounds)
+            if len(iterations) < committed_rounds:
+                logger.warning(
+                    "Iteration log %s holds %d of %d committed rounds, resuming after round %d",
+                    log_file, len(iterations), committed_rounds, len(iterations)
+                )
+                return cls._replay(data, iterations)
+            data["iterations"] = iterations
 
-        return cls.model_validate_json(state_file.read_text())
+        return cls.model_validate(data)
+
+    @classmethod
+    def _replay(
+        cls,
+        header: Dict[str, Any],
+        iterations: List[IterationRecord]
+    ) -> "RefinementState":
+        """Rebuild round, EMA quality and feedback from header settings and iterations."""
+        state = cls.model_validate({
+            **header,
+            "current_round": 0,
+            "iterations": [],
+            "cumulative_feedback": [],
+            "ema_quality": 0.0,
+        })
+        for iteration in iterations:
+            state = state.add_iteration(iteration, updated_at=state.updated_at)
+        return state
+
+
+def _replace_file(path: Path, data: bytes, durable: bool) -> None:
+    """Write data to a temp file beside path, optionally fsync it, then os.replace."""
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+def _iteration_line(record: IterationRecord) -> bytes:
+    """One JSONL line for record, serialized straight to bytes by pydantic-core."""
+    return record.__pydantic_serializer__.to_json(record) + b"\n"
+
+
+def _read_iterations(log_file: Path, committed_rounds: int) -> List[IterationRecord]:
+    """
+    Read the committed iterations from a state's JSONL log.
+
+    A record appended before a crash (header not yet rewritten) may be
+    followed by a retry of the same round; the last record for each round
+    wins, and rounds beyond the header's current_round are ignored. Reading
+    stops at the first missing round, so the result is always rounds 1..n.
+    """
+    by_round: Dict[int, IterationRecord] = {}
+    try:
+        with open(log_file, "rb") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = IterationRecord.model_validate_json(line)
+                except ValidationError as e:
+                    logger.warning(
+                        f"Skipping unreadable iteration record {log_file}:{line_number}: {e}"
+                    )
+                    continue
+                by_round[record.round] = record
+    except FileNotFoundError:
+        pass
+
+    iterations = []
+    for r in range(1, committed_rounds + 1):
+        if r not in by_round:
+            break
+        iterations.append(by_round[r])
+    return iterations
@@ -0,0 +1,140 @@
+"""
+Shared Helpers
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Small helpers shared across packages: storage directories and task_id
+checks (metrics, feedback), JSON bytes encoding (orjson when installed) and
+refinement.conf parsing (refinement engine, context retriever).
+Kept free of heavy imports (no pydantic, no numpy) so any module can use them.
+
+Usage:
+    from sdd.utils import ensure_dir, in_dir, json_dumps, parse_config
+
+    ensure_dir(feedback_dir)  # mkdir once per process
+    in_dir(feedback_dir, lambda: meta_file.write_bytes(data))  # recreates if removed
+    config = parse_config(str(path), path.stat().st_mtime_ns)
+    meta_file.write_bytes(json_dumps(meta))
+"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Set, TypeVar
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json fallback
+    orjson = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+# Canonical hyphenated UUID, matched before falling back to uuid.UUID parsing
+_UUID_RE = re.compile(
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+)
+
+# Directories already created by this process (ensure_dir skips mkdir for them)
+_created_dirs: Set[str] = set()
+
+
+def ensure_dir(directory: Path, force: bool = False) -> None:
+    """
+    Create directory (and parents) once per process.
+
+    Args:
+        directory: Directory to create
+        force: Call mkdir even if this process created it before (it was removed)
+    """
+    key = str(directory)
+    if force or key not in _created_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(key)
+
+
+def in_dir(directory: Path, operation: Callable[[], T]) -> T:
+    """
+    Run a file operation inside directory, recreating it if it was removed.
+
+    ensure_dir remembers directories it created, so one deleted later (cleanup,
+    archiving, a reused temp dir) surfaces as FileNotFoundError here; the
+    directory is then recreated and the operation retried once. Errors for
+    other missing paths (directory still present) propagate unchanged.
+
+    Args:
+        directory: Directory the operation writes into
+        operation: Callable performing the write
+
+    Returns:
+        The operation's result
+    """
+    try:
+        return operation()
+    except FileNotFoundError:
+        if directory.is_dir():
+            raise
+        ensure_dir(directory, force=True)
+        return operation()
+
+
+def is_uuid(value: str) -> bool:
+    """Whether value is a valid UUID (canonical form checked without building one)."""
+    if _UUID_RE.fullmatch(value):
+        return True
+    try:
+        UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize obj to JSON bytes (orjson when installed).
+
+    Output is compact; indentation is opt-in via pretty (human-read files).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=8)
+def parse_config(path: str, mtime_ns: int) -> Mapping[str, str]:
+    """
+    Parse a KEY=value config file (refinement.conf) into a read-only mapping.
+
+    Blank lines and # comments are skipped; values lose surrounding double
+    quotes. Cached by (path, mtime_ns), so every component reading an
+    unchanged file shares one parse; editing the file changes the key and
+    forces a re-read. Callers stat the file and handle a missing one.
+
+    Args:
+        path: Config file path
+        mtime_ns: The file's st_mtime_ns (cache key only)
+
+    Returns:
+        Read-only mapping of settings
+    """
+    config = {}
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if '=' in line:
+                key, value = line.split('=', 1)
+                config[key.strip()] = value.strip().strip('"')
+
+    return MappingProxyType(config)
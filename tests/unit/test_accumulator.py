@@ -0,0 +1,199 @@
+"""
+Unit Tests for Feedback Accumulator
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Covers JSONL feedback storage, cumulative retrieval, legacy migration,
+and archival.
+"""
+
+import json
+import shutil
+
+import pytest
+
+from sdd.feedback.accumulator import FeedbackAccumulator, FeedbackHistory, FeedbackRecord
+
+TASK_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+@pytest.fixture
+def accumulator(tmp_path):
+    return FeedbackAccumulator(
+        feedback_dir=str(tmp_path / "feedback"),
+        archive_dir=str(tmp_path / "feedback" / "archive"),
+    )
+
+
+def _add(accumulator, iteration, feedback="Add contract for POST /api/users", score=0.7):
+    return accumulator.add(
+        task_id=TASK_ID,
+        feedback=feedback,
+        iteration=iteration,
+        quality_score=score,
+        agent_id="quality.verifier",
+    )
+
+
+@pytest.mark.unit
+def test_add_appends_one_jsonl_line_per_record(accumulator):
+    _add(accumulator, 1, "Define error codes")
+    history = _add(accumulator, 2, "Add rate limits", score=0.8)
+
+    lines = (accumulator.feedback_dir / f"{TASK_ID}.jsonl").read_text().splitlines()
+    assert [json.loads(line)["feedback"] for line in lines] == [
+        "Define error codes", "Add rate limits"
+    ]
+    assert len(history.records) == 2
+    assert history.updated_at >= history.created_at
+    assert accumulator.get_cumulative(TASK_ID) == ["Define error codes", "Add rate limits"]
+    assert accumulator.get_cumulative(TASK_ID, max_records=1) == ["Add rate limits"]
+    assert accumulator.get_cumulative(TASK_ID, max_records=5) == [
+        "Define error codes", "Add rate limits"
+    ]
+    assert accumulator.get_quality_progression(TASK_ID) == [0.7, 0.8]
+
+
+@pytest.mark.unit
+def test_torn_trailing_line_is_skipped(accumulator):
+    _add(accumulator, 1)
+    with open(accumulator.feedback_dir / f"{TASK_ID}.jsonl", "a") as f:
+        f.write('{"iteration": 2, "feedb')
+
+    assert len(accumulator.get_cumulative(TASK_ID)) == 1
+
+
+@pytest.mark.unit
+def test_max_records_reads_only_the_tail(accumulator, monkeypatch):
+    monkeypatch.setattr("sdd.feedback.accumulator._TAIL_BLOCK_SIZE", 64)
+    for iteration in range(1, 21):
+        _add(accumulator, iteration, f"Feedback number {iteration}")
+    with open(accumulator.feedback_dir / f"{TASK_ID}.jsonl", "a") as f:
+        f.write("\n\n")
+
+    assert accumulator.get_cumulative(TASK_ID, max_records=3) == [
+        "Feedback number 18", "Feedback number 19", "Feedback number 20"
+    ]
+    assert len(accumulator.get_cumulative(TASK_ID, max_records=50)) == 20
+
+
+@pytest.mark.unit
+def test_legacy_json_history_is_read_and_migrated(accumulator):
+    legacy = FeedbackHistory(
+        task_id=TASK_ID,
+        records=[FeedbackRecord(
+            iteration=1, feedback="Legacy item", quality_score=0.5, agent_id="quality.verifier"
+        )],
+    )
+    legacy_file = accumulator.feedback_dir / f"{TASK_ID}.json"
+    legacy_file.write_text(legacy.model_dump_json(indent=2))
+
+    assert accumulator.get_cumulative(TASK_ID) == ["Legacy item"]
+
+    history = _add(accumulator, 2, "New item")
+
+    assert not legacy_file.exists()
+    assert [r.feedback for r in history.records] == ["Legacy item", "New item"]
+    assert history.created_at == legacy.created_at
+
+
+@pytest.mark.unit
+def test_legacy_migration_does_not_depend_on_reading_the_sidecar_back(
+    accumulator, monkeypatch
+):
+    legacy = FeedbackHistory(task_id=TASK_ID)
+    (accumulator.feedback_dir / f"{TASK_ID}.json").write_text(legacy.model_dump_json())
+    monkeypatch.setattr(accumulator, "_load_meta", lambda task_id: None)
+
+    meta = accumulator._load_or_create_meta(TASK_ID)
+
+    assert meta['created_at'] == legacy.created_at.isoformat()
+    assert meta['archived'] is False
+    assert [r.feedback for r in _add(accumulator, 1, "New item").records] == ["New item"]
+
+
+@pytest.mark.unit
+def test_archive_and_clear_remove_all_history_files(accumulator):
+    _add(accumulator, 1, "First")
+    _add(accumulator, 2, "Second")
+    assert accumulator.archive(TASK_ID)
+
+    archived_lines = (accumulator.archive_dir / f"{TASK_ID}.jsonl").read_text().splitlines()
+    assert [json.loads(line)["feedback"] for line in archived_lines] == ["First", "Second"]
+    meta = json.loads((accumulator.archive_dir / f"{TASK_ID}.meta.json").read_text())
+    assert meta["archived"] is True
+    assert list(accumulator.feedback_dir.glob(f"{TASK_ID}*")) == []
+    assert accumulator.get_history(TASK_ID) is None
+
+    _add(accumulator, 1)
+    assert accumulator.clear(TASK_ID)
+    assert not accumulator.clear(TASK_ID)
+
+
+@pytest.mark.unit
+def test_removed_directories_are_recreated_on_write(accumulator):
+    shutil.rmtree(accumulator.feedback_dir)
+    again = FeedbackAccumulator(
+        feedback_dir=str(accumulator.feedback_dir), archive_dir=str(accumulator.archive_dir)
+    )
+
+    _add(again, 1, "First")
+    assert again.get_cumulative(TASK_ID) == ["First"]
+    assert again.archive(TASK_ID)
+    assert (again.archive_dir / f"{TASK_ID}.jsonl").exists()
+
+
+@pytest.mark.unit
+def test_archive_moves_records_without_parsing_them(accumulator, monkeypatch):
+    _add(accumulator, 1, "First")
+    records_bytes = (accumulator.feedback_dir / f"{TASK_ID}.jsonl").read_bytes()
+    fresh = FeedbackAccumulator(
+        feedback_dir=str(accumulator.feedback_dir), archive_dir=str(accumulator.archive_dir)
+    )
+    monkeypatch.setattr(
+        FeedbackRecord, "model_validate_json", lambda *a, **kw: pytest.fail("parsed")
+    )
+
+    assert fresh.archive(TASK_ID)
+    assert (accumulator.archive_dir / f"{TASK_ID}.jsonl").read_bytes() == records_bytes
+
+
+@pytest.mark.unit
+def test_history_is_parsed_once_until_the_file_changes(accumulator, monkeypatch):
+    _add(accumulator, 1, "First")
+    _add(accumulator, 2, "Second")
+    original_validate = FeedbackRecord.model_validate_json
+    monkeypatch.setattr(
+        FeedbackRecord, "model_validate_json", lambda *a, **kw: pytest.fail("re-parsed")
+    )
+
+    history = accumulator.get_history(TASK_ID)
+    history.records.clear()
+    assert accumulator.get_cumulative(TASK_ID) == ["First", "Second"]
+    assert accumulator.get_quality_progression(TASK_ID) == [0.7, 0.7]
+
+    # Another writer appending to the log invalidates the cached parse
+    monkeypatch.setattr(FeedbackRecord, "model_validate_json", original_validate)
+    other = FeedbackAccumulator(
+        feedback_dir=str(accumulator.feedback_dir), archive_dir=str(accumulator.archive_dir)
+    )
+    _add(other, 3, "Third")
+    assert accumulator.get_cumulative(TASK_ID) == ["First", "Second", "Third"]
+    returned = _add(accumulator, 4, "Fourth")
+    returned.records.clear()
+    assert accumulator.get_cumulative(TASK_ID)[-1] == "Fourth"
+    assert len(accumulator.get_history(TASK_ID).records) == 4
+
+
+@pytest.mark.unit
+def test_add_accepts_any_uuid_form_and_rejects_others(accumulator):
+    braced = "{" + TASK_ID.upper() + "}"
+    assert accumulator.add(
+        task_id=braced, feedback="Braced id", iteration=1,
+        quality_score=0.5, agent_id="quality.verifier",
+    ).records[0].feedback == "Braced id"
+
+    with pytest.raises(ValueError, match="valid UUID"):
+        accumulator.add(
+            task_id="550e8400-e29b-41d4-a716-44665544000g", feedback="x", iteration=1,
+            quality_score=0.5, agent_id="quality.verifier",
+        )
@@ -0,0 +1,180 @@
+"""
+Unit Tests for Metrics Collector
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Covers task metrics recording, aggregation against the baseline, and
+metrics file loading.
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from sdd.metrics.collector import MetricsCollector
+from sdd.metrics.models import TaskMetrics
+
+TASK_IDS = [
+    "550e8400-e29b-41d4-a716-446655440000",
+    "550e8400-e29b-41d4-a716-446655440001",
+]
+
+
+@pytest.fixture
+def collector(tmp_path):
+    return MetricsCollector(
+        metrics_dir=str(tmp_path / "metrics"),
+        baseline_file=str(tmp_path / "metrics" / "baseline.json"),
+    )
+
+
+def _metrics(task_id, phase="planning", completed=True, rounds=2):
+    return TaskMetrics(
+        task_id=task_id,
+        phase=phase,
+        started_at=datetime(2025, 11, 10, 10, 0),
+        refinement_rounds=rounds,
+        verification_checks=4,
+        verification_passes_first_time=3,
+        completed_without_intervention=completed,
+    )
+
+
+@pytest.mark.unit
+def test_metrics_files_are_parsed_once_until_changed(collector, monkeypatch):
+    collector.record_task(_metrics(TASK_IDS[0], rounds=2))
+    collector.record_task(_metrics(TASK_IDS[1], phase="validation", completed=False, rounds=4))
+    assert collector.get_aggregate_metrics()['task_count'] == 2
+
+    original_validate = TaskMetrics.model_validate_json
+    monkeypatch.setattr(
+        TaskMetrics, "model_validate_json", lambda *a, **kw: pytest.fail("re-parsed")
+    )
+    aggregate = collector.get_aggregate_metrics()
+    assert aggregate['task_completion_accuracy'] == 50.0
+    assert aggregate['avg_refinement_rounds'] == 3.0
+    assert collector.get_aggregate_metrics(phase="validation")['task_count'] == 1
+
+    # Rewritten files are parsed again; deleted files drop out
+    monkeypatch.setattr(TaskMetrics, "model_validate_json", original_validate)
+    collector.record_task(_metrics(TASK_IDS[1], phase="validation", completed=True, rounds=6))
+    (collector.metrics_dir / "planning" / f"{TASK_IDS[0]}.json").unlink()
+
+    aggregate = collector.get_aggregate_metrics()
+    assert aggregate['task_count'] == 1
+    assert aggregate['avg_refinement_rounds'] == 6.0
+
+
+@pytest.mark.unit
+def test_export_report_aggregates_phases_from_one_scan(collector, monkeypatch, tmp_path):
+    collector.record_task(_metrics(TASK_IDS[0], rounds=2))
+    collector.record_task(_metrics(TASK_IDS[1], phase="validation", completed=False, rounds=4))
+    expected = {
+        phase: collector.get_aggregate_metrics(phase=phase) for phase in ("planning", "validation")
+    }
+    overall = collector.get_aggregate_metrics()
+
+    scans = []
+    original_load = collector._load_all_metrics
+    monkeypatch.setattr(
+        collector, "_load_all_metrics", lambda **kw: scans.append(kw) or original_load(**kw)
+    )
+    report = json.loads(Path(collector.export_metrics_report(str(tmp_path / "r.json"))).read_text())
+
+    assert len(scans) == 1
+    assert report['by_phase'] == expected
+    assert report['aggregate'] == overall
+    assert {task['task_id'] for task in report['tasks']} == set(TASK_IDS)
+
+
+@pytest.mark.unit
+def test_record_tasks_writes_every_phase_without_reparsing(collector, monkeypatch):
+    collector.record_tasks([
+        _metrics(TASK_IDS[0], rounds=2),
+        _metrics(TASK_IDS[1], phase="validation", completed=False, rounds=4),
+    ])
+
+    assert (collector.metrics_dir / "planning" / f"{TASK_IDS[0]}.json").exists()
+    assert TaskMetrics.load_from_file(
+        TASK_IDS[1], "validation", base_path=str(collector.metrics_dir)
+    ).refinement_rounds == 4
+
+    monkeypatch.setattr(
+        TaskMetrics, "model_validate_json", lambda *a, **kw: pytest.fail("re-parsed")
+    )
+    assert collector.get_aggregate_metrics()['avg_refinement_rounds'] == 3.0
+
+
+@pytest.mark.unit
+def test_calculate_improvement_needs_a_baseline(collector, monkeypatch):
+    collector.record_task(_metrics(TASK_IDS[0], completed=True))
+    collector.record_task(_metrics(TASK_IDS[1], completed=False))
+
+    monkeypatch.setattr(collector, "_load_all_metrics", lambda **kw: pytest.fail("scanned"))
+    assert collector.calculate_improvement() == 0.0
+
+    monkeypatch.undo()
+    collector.set_baseline(task_completion_accuracy=20.0)
+    assert collector.calculate_improvement() == pytest.approx(2.5)
+
+
+@pytest.mark.unit
+def test_structured_metrics_are_encoded_only_when_logged(collector, caplog, monkeypatch):
+    with caplog.at_level("INFO", logger="sdd.metrics.collector"):
+        collector.record_task(_metrics(TASK_IDS[0], rounds=3))
+    line = next(r.getMessage() for r in caplog.records if "STRUCTURED_METRICS" in r.msg)
+    assert json.loads(line.split(": ", 1)[1])['refinement_rounds'] == 3
+
+    monkeypatch.setattr(json, "dumps", lambda *a, **kw: pytest.fail("encoded"))
+    with caplog.at_level("WARNING", logger="sdd.metrics.collector"):
+        collector._log_structured_metrics(_metrics(TASK_IDS[1]))
+
+
+@pytest.mark.unit
+def test_constructor_creates_metrics_dir_once(collector, monkeypatch):
+    assert collector.metrics_dir.is_dir()
+
+    monkeypatch.setattr(Path, "mkdir", lambda *a, **kw: pytest.fail("mkdir"))
+    again = MetricsCollector(
+        metrics_dir=str(collector.metrics_dir), baseline_file=str(collector.baseline_file)
+    )
+    assert again.metrics_dir == collector.metrics_dir
+
+
+@pytest.mark.unit
+def test_removed_metrics_dir_reads_as_empty(collector):
+    shutil.rmtree(collector.metrics_dir)
+    again = MetricsCollector(
+        metrics_dir=str(collector.metrics_dir), baseline_file=str(collector.baseline_file)
+    )
+
+    assert again.get_aggregate_metrics() == collector.get_aggregate_metrics()
+
+
+@pytest.mark.unit
+def test_collector_import_and_baseline_do_not_load_pydantic(tmp_path):
+    code = (
+        "import sys, logging; logging.disable(logging.CRITICAL)\n"
+        "from sdd.metrics.collector import MetricsCollector\n"
+        f"c = MetricsCollector(metrics_dir={str(tmp_path)!r}, "
+        f"baseline_file={str(tmp_path / 'b.json')!r})\n"
+        "c.set_baseline(task_completion_accuracy=20.0)\n"
+        "assert 'pydantic' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.unit
+def test_baseline_round_trips_and_survives_a_corrupt_file(collector):
+    collector.set_baseline(task_completion_accuracy=20.0, avg_refinement_rounds=5.0, task_count=50)
+    reloaded = MetricsCollector(
+        metrics_dir=str(collector.metrics_dir), baseline_file=str(collector.baseline_file)
+    ).baseline
+    assert reloaded.to_dict() == collector.baseline.to_dict()
+
+    collector.baseline_file.write_text("{not json")
+    assert collector._load_baseline().task_completion_accuracy == 0.0
@@ -0,0 +1,270 @@
+"""
+Unit Tests for Agent Communication Channel
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Covers AgentChannel accessors, message queueing, and audit trail output,
+plus the AgentContext append helpers used during handoff.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from sdd.agents.shared.communication import (
+    AgentChannel,
+    MessageEnvelope,
+    deserialize_agent_message,
+    serialize_agent_message,
+    validate_agent_communication_contract,
+)
+from sdd.agents.shared.models import AgentContext, AgentInput, AgentOutput
+
+TASK_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+def _make_input(agent_id: str = "quality.verifier") -> AgentInput:
+    return AgentInput(
+        agent_id=agent_id,
+        task_id=TASK_ID,
+        phase="planning",
+        input_data={},
+        context=AgentContext(),
+    )
+
+
+@pytest.fixture
+def channel(tmp_path):
+    return AgentChannel(audit_dir=str(tmp_path / "communication"))
+
+
+@pytest.mark.unit
+def test_invocation_chain_view_is_live_and_read_only(channel):
+    chain = channel.get_invocation_chain()
+    channel.send(_make_input("quality.verifier"))
+    channel.send(_make_input("architecture.router"))
+
+    assert list(chain) == ["quality.verifier", "architecture.router"]
+    assert chain == ["quality.verifier", "architecture.router"]
+    assert not hasattr(chain, "append")
+
+
+@pytest.mark.unit
+def test_invocation_chain_copy_is_snapshot(channel):
+    channel.send(_make_input())
+    snapshot = channel.get_invocation_chain_copy()
+    channel.clear()
+
+    assert snapshot == ["quality.verifier"]
+    assert len(channel.get_invocation_chain()) == 0
+
+
+@pytest.mark.unit
+def test_add_output_rejects_out_of_order_output():
+    def make_output(timestamp):
+        return AgentOutput(
+            agent_id="quality.verifier",
+            task_id=TASK_ID,
+            success=True,
+            output_data={},
+            reasoning="ok",
+            confidence=0.9,
+            next_actions=[],
+            timestamp=timestamp,
+        )
+
+    now = datetime.now()
+    context = AgentContext().add_output(make_output(now))
+
+    with pytest.raises(ValueError, match="chronologically"):
+        context.add_output(make_output(now - timedelta(seconds=1)))
+    assert len(context.add_output(make_output(now)).previous_outputs) == 2
+    assert len(context.previous_outputs) == 1
+
+
+@pytest.mark.unit
+def test_export_audit_trail_is_compact_json(channel, tmp_path):
+    output = AgentOutput(
+        agent_id="quality.verifier",
+        task_id=TASK_ID,
+        success=True,
+        output_data={},
+        reasoning="ok",
+        confidence=0.9,
+        next_actions=[],
+    )
+    channel.send(_make_input())
+    channel.handoff(
+        from_agent="quality.verifier",
+        to_agent="architecture.router",
+        context=AgentContext().add_output(output),
+    )
+
+    audit_path = channel.export_audit_trail(TASK_ID, str(tmp_path / "audit.json"))
+    raw = Path(audit_path).read_text()
+    audit = json.loads(raw)
+
+    assert "\n" not in raw
+    assert audit["invocation_chain"] == ["quality.verifier"]
+    assert audit["handoff_history"][0]["to_agent"] == "architecture.router"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("agent_id", ["Quality.verifier", "quality", "quality.", "a.b.c", "qa1.x"])
+def test_agent_id_format_is_enforced(agent_id):
+    with pytest.raises(ValidationError):
+        _make_input(agent_id)
+
+
+@pytest.mark.unit
+def test_agent_id_is_interned():
+    dynamic_id = "".join(["quality", ".", "verifier"])
+    assert _make_input(dynamic_id).agent_id is _make_input("quality.verifier").agent_id
+
+
+@pytest.mark.unit
+def test_message_ids_are_time_ordered_uuid7(channel):
+    first = channel.send(_make_input())
+    time.sleep(0.002)
+    second = channel.send(_make_input())
+
+    assert UUID(first).version == 7
+    assert first < second
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pretty", [False, True])
+def test_export_audit_trail_streams_all_handoffs(channel, tmp_path, pretty):
+    for to_agent in ("architecture.router", "engineering.autodebug", "quality.finalizer"):
+        channel.handoff(from_agent="quality.verifier", to_agent=to_agent, context=AgentContext())
+
+    audit_path = channel.export_audit_trail(TASK_ID, str(tmp_path / "audit.json"), pretty=pretty)
+    audit = json.loads(Path(audit_path).read_text())
+
+    assert list(audit) == [
+        "task_id", "generated_at", "invocation_chain", "handoff_history", "message_count"
+    ]
+    assert [h["to_agent"] for h in audit["handoff_history"]] == [
+        "architecture.router", "engineering.autodebug", "quality.finalizer"
+    ]
+    assert audit["message_count"] == 0
+
+
+@pytest.mark.unit
+def test_receive_filters_by_agent_and_preserves_fifo(channel):
+    channel.send(_make_input("quality.verifier"))
+    channel.send(_make_input("architecture.router"))
+
+    assert channel.receive(agent_id="architecture.router").agent_id == "architecture.router"
+    assert channel.receive(agent_id="architecture.router") is None
+    assert channel.receive().agent_id == "quality.verifier"
+    assert channel.receive() is None
+
+
+@pytest.mark.unit
+def test_blocking_receive_wakes_on_send(channel):
+    sender = threading.Timer(0.05, channel.send, args=(_make_input(),))
+    sender.start()
+    try:
+        received = channel.receive(agent_id="quality.verifier", timeout_seconds=5, block=True)
+    finally:
+        sender.join()
+
+    assert received is not None
+    assert channel.receive(timeout_seconds=0, block=True) is None
+
+
+@pytest.mark.unit
+def test_received_envelopes_are_recycled(channel):
+    MessageEnvelope._pool.clear()
+    first_id = channel.send(_make_input())
+    channel.receive()
+
+    assert len(MessageEnvelope._pool) == 1
+    second_id = channel.send(_make_input())
+    assert len(MessageEnvelope._pool) == 0
+    assert second_id != first_id
+    assert channel.receive().agent_id == "quality.verifier"
+
+
+@pytest.mark.unit
+def test_add_feedback_appends_batches_without_mutating_original():
+    context = AgentContext().add_feedback("Add contract for POST /api/users")
+    updated = context.add_feedback("Define error codes", "Add rate limits")
+
+    assert context.cumulative_feedback == ["Add contract for POST /api/users"]
+    assert updated.cumulative_feedback == [
+        "Add contract for POST /api/users", "Define error codes", "Add rate limits"
+    ]
+
+
+@pytest.mark.unit
+def test_audit_records_are_batched_until_flush(tmp_path):
+    channel = AgentChannel(audit_dir=str(tmp_path), audit_batch_size=3)
+    messages_file = tmp_path / "messages.jsonl"
+
+    channel.send(_make_input())
+    channel.send(_make_input())
+    assert not messages_file.exists()
+
+    channel.send(_make_input())
+    channel.send(_make_input())
+    assert len(messages_file.read_text().splitlines()) == 3
+
+    channel.flush_audit()
+    records = [json.loads(line) for line in messages_file.read_text().splitlines()]
+    assert len(records) == 4
+    assert all(r["receiver"] == "quality.verifier" for r in records)
+
+
+@pytest.mark.unit
+def test_background_audit_writes_all_records(tmp_path):
+    channel = AgentChannel(audit_dir=str(tmp_path), background_audit=True)
+    for _ in range(50):
+        channel.send(_make_input())
+    channel.handoff(from_agent="quality.verifier", to_agent="architecture.router",
+                    context=AgentContext())
+
+    channel.flush_audit()
+
+    assert len((tmp_path / "messages.jsonl").read_text().splitlines()) == 50
+    assert len((tmp_path / "handoffs.jsonl").read_text().splitlines()) == 1
+
+
+@pytest.mark.unit
+def test_contract_validation_matches_agent_and_task(caplog):
+    def make_output(agent_id):
+        return AgentOutput(
+            agent_id=agent_id,
+            task_id=TASK_ID,
+            success=True,
+            output_data={},
+            reasoning="ok",
+            confidence=0.9,
+            next_actions=[],
+        )
+
+    agent_input = _make_input("quality.verifier")
+
+    assert validate_agent_communication_contract(agent_input, make_output("quality.verifier"))
+    assert not validate_agent_communication_contract(
+        agent_input, make_output("architecture.router")
+    )
+    assert "contract mismatch" in caplog.text
+
+
+@pytest.mark.unit
+def test_deserialize_agent_message_round_trips_json_and_dicts():
+    agent_input = _make_input()
+    json_str = serialize_agent_message(agent_input)
+
+    assert deserialize_agent_message(json_str, AgentInput) == agent_input
+    assert deserialize_agent_message(json_str.encode(), AgentInput) == agent_input
+    assert deserialize_agent_message(json.loads(json_str), AgentInput) == agent_input
+    with pytest.raises(ValidationError):
+        deserialize_agent_message('{"agent_id": "bad"}', AgentInput)
@@ -0,0 +1,124 @@
+"""
+Unit Tests for Metrics Models
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Covers TaskMetrics validation, KPI calculations, and file round trips.
+"""
+
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from sdd.metrics.models import TaskMetrics
+
+TASK_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+def _metrics(**overrides):
+    fields = {
+        "task_id": TASK_ID,
+        "phase": "planning",
+        "started_at": datetime(2025, 11, 10, 10, 0),
+    }
+    fields.update(overrides)
+    return TaskMetrics(**fields)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("field", ["refinement_quality_scores", "context_relevance_scores"])
+def test_scores_must_be_within_unit_range(field):
+    assert getattr(_metrics(**{field: [0.0, 0.5, 1.0]}), field) == [0.0, 0.5, 1.0]
+
+    for bad in ([0.5, 1.2], [-0.1]):
+        with pytest.raises(ValidationError, match=field):
+            _metrics(**{field: bad})
+
+
+@pytest.mark.unit
+def test_task_id_accepts_uuid_forms_and_keeps_the_string():
+    assert _metrics(task_id=TASK_ID.upper()).task_id == TASK_ID.upper()
+    assert _metrics(task_id=TASK_ID.replace("-", "")).task_id == TASK_ID.replace("-", "")
+
+    for bad in ("not-a-uuid", TASK_ID[:-1], TASK_ID + "0"):
+        with pytest.raises(ValidationError, match="task_id"):
+            _metrics(task_id=bad)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("overrides, message", [
+    ({"completed_at": datetime(2025, 11, 10, 10, 2)}, "duration_seconds must be set"),
+    ({"errors_encountered": 1, "errors_auto_resolved": 2}, "errors_auto_resolved"),
+    ({"verification_checks": 1, "verification_passes_first_time": 2}, "verification_checks"),
+])
+def test_cross_field_constraints(overrides, message):
+    with pytest.raises(ValidationError, match=message):
+        _metrics(**overrides)
+
+
+@pytest.mark.unit
+def test_average_kpis_handle_empty_and_filled_lists():
+    empty = _metrics()
+    assert empty.calculate_avg_refinement_quality() == 0.0
+    assert empty.calculate_avg_context_relevance() == 0.0
+    assert empty.export_for_analysis()["avg_debug_iterations"] == 0.0
+
+    filled = _metrics(
+        refinement_quality_scores=[0.7, 0.8, 0.9],
+        context_relevance_scores=[0.5, 1.0],
+        errors_encountered=2,
+        debug_iterations=[3, 2],
+    )
+    assert filled.calculate_avg_refinement_quality() == pytest.approx(0.8)
+    assert filled.calculate_avg_context_relevance() == pytest.approx(0.75)
+    assert filled.export_for_analysis()["avg_debug_iterations"] == 2.5
+
+
+@pytest.mark.unit
+def test_save_to_file_round_trips_and_creates_the_phase_dir_once(tmp_path, monkeypatch):
+    metrics = _metrics(refinement_quality_scores=[0.7])
+    path = metrics.save_to_file(str(tmp_path))
+    assert path == tmp_path / "planning" / f"{TASK_ID}.json"
+    assert TaskMetrics.load_from_file(TASK_ID, "planning", base_path=str(tmp_path)) == metrics
+
+    monkeypatch.setattr(Path, "mkdir", lambda *a, **kw: pytest.fail("mkdir"))
+    _metrics(task_id=TASK_ID.upper()).save_to_file(str(tmp_path))
+
+
+@pytest.mark.unit
+def test_save_to_file_recreates_a_removed_phase_dir(tmp_path):
+    _metrics().save_to_file(str(tmp_path))
+    shutil.rmtree(tmp_path / "planning")
+
+    metrics = _metrics(refinement_quality_scores=[0.9])
+    metrics.save_to_file(str(tmp_path))
+    assert TaskMetrics.load_from_file(TASK_ID, "planning", base_path=str(tmp_path)) == metrics
+
+
+@pytest.mark.unit
+def test_save_many_round_trips_through_parquet_with_filters(tmp_path):
+    pytest.importorskip("pyarrow")
+    other_id = "550e8400-e29b-41d4-a716-446655440001"
+    planning = _metrics(refinement_quality_scores=[0.7, 0.9], debug_iterations=[2])
+    validation = _metrics(task_id=other_id, phase="validation", completed_without_intervention=True)
+
+    path = TaskMetrics.save_many([planning, validation], str(tmp_path / "metrics.parquet"))
+
+    assert TaskMetrics.load_many(str(path)) == [planning, validation]
+    assert TaskMetrics.load_many(str(path), phase="validation") == [validation]
+    assert TaskMetrics.load_many(str(path), task_ids=[TASK_ID]) == [planning]
+
+
+@pytest.mark.unit
+def test_export_for_analysis_has_epoch_timestamps():
+    started = datetime(2025, 11, 10, 10, 0)
+    completed = datetime(2025, 11, 10, 10, 2)
+
+    running = _metrics(started_at=started).export_for_analysis()
+    assert running["started_at_epoch"] == started.timestamp()
+    assert running["completed_at_epoch"] is None
+
+    done = _metrics(started_at=started, completed_at=completed, duration_seconds=120.0)
+    assert done.export_for_analysis()["completed_at_epoch"] - running["started_at_epoch"] == 120.0
@@ -0,0 +1,260 @@
+"""
+Unit Tests for Refinement Engine
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Covers configuration loading, per-phase quality thresholds, and concurrent
+refinement loops.
+"""
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from sdd.refinement import engine as engine_module
+from sdd.refinement import models as models_module
+from sdd.refinement.engine import RefinementEngine
+from sdd import utils as utils_module
+
+CONFIG = """\
+# Refinement settings
+MAX_REFINEMENT_ROUNDS=5
+EARLY_STOP_THRESHOLD="0.97"
+PLAN_QUALITY_THRESHOLD=0.7
+MAX_PARALLEL_AGENTS=2
+"""
+
+TASK_IDS = [
+    "550e8400-e29b-41d4-a716-446655440000",
+    "550e8400-e29b-41d4-a716-446655440001",
+]
+
+
+class _CountingVerifier:
+    """Insufficient on every call; counts calls."""
+
+    agent_id = "quality.verifier"
+
+    def __init__(self):
+        self.calls = 0
+
+    def verify(self, agent_input):
+        self.calls += 1
+        return SimpleNamespace(output_data={
+            "decision": "insufficient",
+            "quality_score": 0.5,
+            "dimension_scores": {"completeness": 0.5},
+            "feedback": ["Add a risks section"],
+        })
+
+
+class _SlowVerifier:
+    """Sufficient on every call; records how many calls overlap."""
+
+    agent_id = "quality.verifier"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+
+    def verify(self, agent_input):
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        time.sleep(0.02)
+        with self._lock:
+            self._active -= 1
+        return SimpleNamespace(output_data={
+            "decision": "sufficient",
+            "quality_score": 0.99,
+            "dimension_scores": {"completeness": 0.99},
+        })
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "refinement.conf"
+    path.write_text(CONFIG)
+    return path
+
+
+def _engine(config_file):
+    return RefinementEngine(
+        config_path=str(config_file),
+        state_dir=str(config_file.parent / "state"),
+    )
+
+
+@pytest.mark.unit
+def test_config_sets_limits_and_phase_thresholds(config_file):
+    engine = _engine(config_file)
+
+    assert engine.max_rounds == 5
+    assert engine.early_stop_threshold == 0.97
+    assert engine._get_quality_threshold("Planning") == 0.7
+    assert engine._get_quality_threshold("specification") == 0.90
+    assert engine._get_quality_threshold("deployment") == 0.85
+
+
+@pytest.mark.unit
+def test_config_is_parsed_once_until_the_file_changes(config_file, monkeypatch):
+    _engine(config_file)
+    monkeypatch.setattr(
+        utils_module, "open", lambda *a, **kw: pytest.fail("re-read"), raising=False
+    )
+    assert _engine(config_file).max_rounds == 5
+
+    monkeypatch.undo()
+    config_file.write_text(CONFIG.replace("=5", "=8"))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _engine(config_file).max_rounds == 8
+
+
+@pytest.mark.unit
+def test_missing_config_raises(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+        _engine(tmp_path / "missing.conf")
+
+
+@pytest.mark.unit
+def test_refine_many_runs_independent_loops_concurrently(config_file):
+    engine = _engine(config_file)
+    assert engine.max_parallel == 2
+    verifier = _SlowVerifier()
+    artifact = config_file.parent / "plan.md"
+    artifact.write_text("# Plan")
+
+    states = engine.refine_many_until_sufficient([
+        {"task_id": task_id, "phase": "planning", "artifact_path": str(artifact),
+         "verifier": verifier}
+        for task_id in TASK_IDS
+    ])
+
+    assert [state.task_id for state in states] == TASK_IDS
+    assert all(state.current_round >= 1 for state in states)
+    assert verifier.max_active == 2
+
+
+@pytest.mark.unit
+def test_refine_many_rejects_duplicate_task_ids(config_file):
+    task = {"task_id": TASK_IDS[0], "phase": "planning", "artifact_path": "plan.md",
+            "verifier": _SlowVerifier()}
+    with pytest.raises(ValueError, match="unique"):
+        _engine(config_file).refine_many_until_sufficient([task, dict(task)])
+
+
+@pytest.mark.unit
+def test_unchanged_artifact_is_verified_once_per_loop(config_file):
+    engine = _engine(config_file)
+    artifact = config_file.parent / "plan.md"
+    artifact.write_text("# Plan")
+
+    verifier = _CountingVerifier()
+    state = engine.refine_until_sufficient(TASK_IDS[0], "planning", str(artifact), verifier)
+    assert state.current_round == 5
+    assert verifier.calls == 1
+    assert [i.agent_invocations for i in state.iterations[:2]] == [["quality.verifier"], []]
+    assert {i.quality_score for i in state.iterations} == {0.5}
+    assert state.updated_at == state.iterations[-1].timestamp
+
+    def refine(state):
+        artifact.write_text(f"# Plan v{state.current_round}")
+
+    verifier = _CountingVerifier()
+    engine.refine_until_sufficient(
+        TASK_IDS[1], "planning", str(artifact), verifier, refinement_fn=refine
+    )
+    assert verifier.calls == 5
+
+
+@pytest.mark.unit
+def test_max_rounds_writes_escalation_report(config_file):
+    engine = _engine(config_file)
+    artifact = config_file.parent / "plan.md"
+    artifact.write_text("# Plan")
+
+    engine.refine_until_sufficient(TASK_IDS[0], "planning", str(artifact), _CountingVerifier())
+
+    report = (engine.state_dir / f"{TASK_IDS[0]}_escalation.txt").read_text()
+    assert "Cumulative Feedback (5 items):\n\n  1. Add a risks section\n" in report
+    assert report.count("    Decision: ") == 5
+    assert report.rstrip().endswith("=" * 80)
+
+
+@pytest.mark.unit
+def test_existing_state_is_resumed(config_file):
+    engine = _engine(config_file)
+    artifact = config_file.parent / "plan.md"
+    artifact.write_text("# Plan")
+    first = engine.refine_until_sufficient(
+        TASK_IDS[0], "planning", str(artifact), _CountingVerifier()
+    )
+
+    verifier = _CountingVerifier()
+    resumed = engine.refine_until_sufficient(TASK_IDS[0], "planning", str(artifact), verifier)
+    assert resumed == first
+    assert verifier.calls == 0
+
+
+@pytest.mark.unit
+def test_round_log_messages_are_formatted_lazily(config_file, caplog):
+    engine = _engine(config_file)
+    artifact = config_file.parent / "plan.md"
+    artifact.write_text("# Plan")
+
+    with caplog.at_level("INFO", logger=engine_module.__name__):
+        engine.refine_until_sufficient(TASK_IDS[0], "planning", str(artifact), _CountingVerifier())
+
+    complete = [r for r in caplog.records if r.msg.startswith("Iteration %d complete")]
+    assert len(complete) == 5
+    assert complete[0].getMessage() == (
+        "Iteration 1 complete: quality=0.500, ema_quality=0.150, decision=insufficient"
+    )
+
+
+@pytest.mark.unit
+def test_state_is_fsynced_every_few_rounds_and_at_loop_end(config_file, monkeypatch):
+    synced = []
+    monkeypatch.setattr(models_module.os, "fsync", synced.append)
+    engine = _engine(config_file)
+    artifact = config_file.parent / "plan.md"
+    artifact.write_text("# Plan")
+
+    engine.refine_until_sufficient(TASK_IDS[0], "planning", str(artifact), _CountingVerifier())
+
+    # Rounds 4 (every 4th) and 5 (max rounds): iteration log + header each
+    assert len(synced) == 4
+    assert not list(engine.state_dir.glob("*.tmp"))
+
+
+@pytest.mark.unit
+def test_rounds_lost_from_an_unsynced_log_are_re_run(config_file):
+    engine = _engine(config_file)
+    artifact = config_file.parent / "plan.md"
+    artifact.write_text("# Plan")
+
+    def crash_after_round_3(state):
+        if state.current_round == 3:
+            raise RuntimeError("power loss")
+
+    with pytest.raises(RuntimeError):
+        engine.refine_until_sufficient(
+            TASK_IDS[0], "planning", str(artifact), _CountingVerifier(),
+            refinement_fn=crash_after_round_3
+        )
+
+    # Rounds 1-3 were not fsync'd: the header survived, the last two appends did not
+    log_file = engine.state_dir / f"{TASK_IDS[0]}.iterations.jsonl"
+    log_file.write_text(log_file.read_text().splitlines(keepends=True)[0])
+
+    resumed = engine.refine_until_sufficient(
+        TASK_IDS[0], "planning", str(artifact), _CountingVerifier()
+    )
+    assert [iteration.round for iteration in resumed.iterations] == [1, 2, 3, 4, 5]
+    assert models_module.RefinementState.load_from_file(
+        TASK_IDS[0], str(engine.state_dir)
+    ) == resumed
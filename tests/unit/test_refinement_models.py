@@ -0,0 +1,110 @@
+"""
+Unit Tests for Refinement Models
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Covers RefinementState persistence: header plus append-only iteration log.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from sdd.refinement.models import IterationRecord, RefinementState
+
+TASK_ID = "550e8400-e29b-41d4-a716-446655440000"
+STARTED = datetime(2025, 11, 10, 10, 0)
+
+
+def _state():
+    return RefinementState(
+        task_id=TASK_ID,
+        phase="planning",
+        current_round=0,
+        max_rounds=5,
+        quality_threshold=0.85,
+        started_at=STARTED,
+        updated_at=STARTED,
+    )
+
+
+def _iteration(round_number, score=0.6):
+    return IterationRecord(
+        round=round_number,
+        timestamp=STARTED + timedelta(minutes=round_number),
+        input_state={"draft": round_number - 1},
+        output_state={"draft": round_number},
+        verification_result={"quality_score": score, "feedback": [f"fix {round_number}"]},
+        quality_score=score,
+        duration_seconds=1.0,
+    )
+
+
+def _run(rounds, base_path):
+    state = _state()
+    for r in range(1, rounds + 1):
+        state = state.add_iteration(_iteration(r, 0.5 + r / 10))
+        state.save_iteration(base_path)
+    return state
+
+
+@pytest.mark.unit
+def test_save_iteration_appends_one_line_per_round(tmp_path):
+    state = _run(3, str(tmp_path))
+
+    header = json.loads((tmp_path / f"{TASK_ID}.json").read_text())
+    assert "iterations" not in header
+    assert header["current_round"] == 3
+    assert len((tmp_path / f"{TASK_ID}.iterations.jsonl").read_text().splitlines()) == 3
+    assert RefinementState.load_from_file(TASK_ID, str(tmp_path)) == state
+
+
+@pytest.mark.unit
+def test_load_ignores_records_past_the_header_and_prefers_retries(tmp_path):
+    state = _run(2, str(tmp_path))
+    log_file = tmp_path / f"{TASK_ID}.iterations.jsonl"
+    orphan = _iteration(3, 0.1).model_dump_json() + "\n"
+    with open(log_file, "a") as f:
+        f.write(orphan + '{"round": 4, "trunc')
+
+    assert RefinementState.load_from_file(TASK_ID, str(tmp_path)) == state
+
+    retried = state.add_iteration(_iteration(3, 0.9))
+    retried.save_iteration(str(tmp_path))
+    assert RefinementState.load_from_file(TASK_ID, str(tmp_path)) == retried
+
+
+@pytest.mark.unit
+def test_load_replays_the_rounds_before_a_dropped_committed_line(tmp_path):
+    _run(3, str(tmp_path))
+    log_file = tmp_path / f"{TASK_ID}.iterations.jsonl"
+    lines = log_file.read_text().splitlines(keepends=True)
+    log_file.write_text(lines[0] + lines[2])
+
+    loaded = RefinementState.load_from_file(TASK_ID, str(tmp_path))
+    assert loaded == _run(1, str(tmp_path / "expected")).model_copy(
+        update={"updated_at": loaded.updated_at}
+    )
+
+    resumed = loaded
+    for r in (2, 3):
+        resumed = resumed.add_iteration(_iteration(r))
+        resumed.save_iteration(str(tmp_path))
+    assert RefinementState.load_from_file(TASK_ID, str(tmp_path)) == resumed
+
+
+@pytest.mark.unit
+def test_legacy_single_file_state_loads_and_migrates(tmp_path):
+    legacy = _state().add_iteration(_iteration(1)).add_iteration(_iteration(2))
+    (tmp_path / f"{TASK_ID}.json").write_text(legacy.model_dump_json(indent=2))
+    assert RefinementState.load_from_file(TASK_ID, str(tmp_path)) == legacy
+
+    resumed = legacy.add_iteration(_iteration(3))
+    resumed.save_iteration(str(tmp_path))
+    assert RefinementState.load_from_file(TASK_ID, str(tmp_path)) == resumed
+
+
+@pytest.mark.unit
+def test_missing_state_raises(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Refinement state not found"):
+        RefinementState.load_from_file(TASK_ID, str(tmp_path))
@@ -0,0 +1,544 @@
+"""
+Unit Tests for Context Retriever
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Covers TF-IDF keyword search ranking and ContextRetriever indexing.
+"""
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sdd.context.retriever import ContextRetriever, TFIDFSearch, _chunk_markdown
+
+
+@pytest.fixture
+def tfidf_search():
+    search = TFIDFSearch()
+    search.add_document("auth.md", "JWT authentication login tokens for the user API")
+    search.add_document("db.md", "Database schema migrations and the repository layer")
+    search.add_document("ui.md", "Frontend login form components and styling")
+    search.add_document("misc.md", "Notes about the project")
+    search.build_index()
+    return search
+
+
+@pytest.mark.unit
+def test_tfidf_search_ranks_matching_document_first(tfidf_search):
+    results = tfidf_search.search("JWT authentication tokens", top_k=2)
+
+    assert [r["path"] for r in results][0] == "auth.md"
+    assert len(results) == 2
+    assert results[0]["similarity"] > results[1]["similarity"]
+    assert 0.0 < results[0]["similarity"] <= 1.0 + 1e-9
+    assert results[0]["content"].startswith("JWT")
+
+
+@pytest.mark.unit
+def test_tfidf_search_unknown_terms_score_zero(tfidf_search):
+    results = tfidf_search.search("kubernetes helm", top_k=10)
+
+    assert len(results) == 4
+    assert all(r["similarity"] == 0.0 for r in results)
+
+
+@pytest.mark.unit
+def test_tfidf_search_empty_index_returns_nothing():
+    search = TFIDFSearch()
+    search.build_index()
+
+    assert search.search("anything") == []
+
+
+@pytest.mark.unit
+def test_tfidf_vocabulary_drops_stopwords_and_prunes_document_frequency():
+    search = TFIDFSearch(min_df=2, max_df_ratio=0.75)
+    search.add_document("a.md", "the api schema and auth")
+    search.add_document("b.md", "the api schema")
+    search.add_document("c.md", "the api login")
+    search.add_document("d.md", "the api notes")
+    search.build_index()
+
+    assert set(search.vocab) == {"schema"}
+    assert search.tfidf_matrix.shape == (4, 1)
+    assert [r["path"] for r in search.search("schema of the api", top_k=2)] == ["a.md", "b.md"]
+
+
+@pytest.mark.unit
+def test_tfidf_tokenizer_keeps_unicode_words_and_underscores():
+    tokens = TFIDFSearch()._tokenize("Größe der API-Schnittstelle: auth_token, café 42")
+
+    assert tokens == ["größe", "der", "api", "schnittstelle", "auth_token", "café", "42"]
+
+
+@pytest.mark.unit
+def test_tfidf_reset_reuses_cached_term_frequencies(monkeypatch):
+    search = TFIDFSearch()
+    search.add_document("auth.md", "jwt token authentication", content_hash="h-auth")
+    search.add_document("db.md", "database schema", content_hash="h-db")
+    search.build_index()
+    expected = search.search("jwt", top_k=2)
+
+    tokenized = []
+    original_tokenize = search._tokenize
+    monkeypatch.setattr(
+        search, "_tokenize", lambda text: tokenized.append(text) or original_tokenize(text)
+    )
+    search.reset()
+    search.add_document("auth.md", "jwt token authentication", content_hash="h-auth")
+    search.add_document("ui.md", "login form", content_hash="h-ui")
+    search.build_index()
+
+    assert tokenized == ["login form"]
+    assert [r["path"] for r in search.search("jwt", top_k=2)] == ["auth.md", "ui.md"]
+    assert expected[0]["path"] == "auth.md"
+    assert set(search._tf_cache) == {"h-auth", "h-ui"}
+
+
+@pytest.mark.unit
+def test_tfidf_term_table_only_keeps_terms_of_indexed_documents():
+    search = TFIDFSearch()
+    search.add_document("auth.md", "jwt token authentication", content_hash="h-auth")
+    for generation in range(20):
+        search.reset()
+        search.add_document("auth.md", "jwt token authentication", content_hash="h-auth")
+        search.add_document("tmp.md", f"scratch{generation} draft{generation}")
+        search.build_index()
+
+    # Compacted once stale terms are the majority: at most twice the live five
+    assert len(search._terms) <= 10
+    assert search._terms == sorted(search._term_ids, key=search._term_ids.get)
+
+    fresh = TFIDFSearch()
+    fresh.add_document("auth.md", "jwt token authentication")
+    fresh.add_document("tmp.md", "scratch19 draft19")
+    fresh.build_index()
+    for query in ("jwt token", "draft19"):
+        assert search.search(query, top_k=2) == fresh.search(query, top_k=2)
+
+
+class _KeywordEmbeddingModel:
+    """Deterministic stand-in for SentenceTransformer (one dim per keyword)."""
+
+    KEYWORDS = ["auth", "database", "frontend", "notes"]
+
+    def encode(self, sentences, **kwargs):
+        vectors = np.array([
+            [float(sentence.lower().count(k)) + 0.01 for k in self.KEYWORDS]
+            for sentence in sentences
+        ], dtype=np.float32)
+        if kwargs.get("normalize_embeddings"):
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+@pytest.fixture
+def retriever(tmp_path):
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir()
+    (specs_dir / "auth.md").write_text("# Auth\nauth auth tokens and auth flows")
+    (specs_dir / "database.md").write_text("# Database\ndatabase schema for the database")
+    (specs_dir / "frontend.md").write_text("# Frontend\nfrontend components")
+
+    retriever = ContextRetriever(
+        config_path=str(tmp_path / "missing.conf"),
+        embeddings_dir=str(tmp_path / "embeddings"),
+        cache_dir=str(tmp_path / "embeddings" / "cache"),
+    )
+    retriever.embedding_model = _KeywordEmbeddingModel()
+    retriever.use_embeddings = True
+    retriever.similarity_threshold = 0.5
+    retriever.build_index(specs_dir=str(specs_dir), docs_dir=str(tmp_path / "no-docs"))
+    return retriever
+
+
+@pytest.mark.unit
+def test_embedding_search_ranks_and_applies_threshold(retriever):
+    results = retriever.retrieve_relevant_specs("auth login", top_k=3)
+
+    assert [Path(r["path"]).name for r in results] == ["auth.md"]
+    assert results[0]["similarity"] > 0.9
+
+
+@pytest.mark.unit
+def test_build_index_encodes_documents_in_one_batch(retriever):
+    calls = []
+    model = _KeywordEmbeddingModel()
+    original_encode = model.encode
+
+    def counting_encode(sentences, **kwargs):
+        calls.append(len(sentences))
+        return original_encode(sentences, **kwargs)
+
+    model.encode = counting_encode
+    for cache_file in retriever.cache_dir.glob("*"):
+        cache_file.unlink()
+
+    cold = ContextRetriever(
+        config_path=str(retriever.config_path),
+        embeddings_dir=str(retriever.embeddings_dir),
+        cache_dir=str(retriever.cache_dir),
+    )
+    cold.embedding_model = model
+    cold.build_index(
+        specs_dir=str(Path(retriever.documents[0]["path"]).parent),
+        docs_dir=str(retriever.cache_dir / "no-docs"),
+    )
+    cold.retrieve_relevant_specs("database", top_k=1)
+
+    assert calls == [3, 1]
+
+
+@pytest.mark.unit
+def test_int8_quantized_embeddings_match_float_ranking(retriever):
+    expected = retriever.retrieve_relevant_specs("database schema", top_k=3)
+
+    retriever.embedding_quantization = "int8"
+    retriever._build_doc_matrix()
+    quantized = retriever.retrieve_relevant_specs("database schema", top_k=3)
+
+    assert retriever.doc_matrix.dtype == np.int8
+    assert [r["path"] for r in quantized] == [r["path"] for r in expected]
+    assert quantized[0]["similarity"] == pytest.approx(expected[0]["similarity"], abs=0.02)
+
+
+@pytest.mark.unit
+def test_hnsw_index_matches_exact_search_and_persists(retriever):
+    pytest.importorskip("faiss")
+    expected = retriever.retrieve_relevant_specs("database schema", top_k=3)
+
+    retriever.ann_backend = "hnsw"
+    retriever.ann_min_documents = 1
+    retriever.build_index(
+        specs_dir=str(Path(retriever.documents[0]["path"]).parent),
+        docs_dir=str(retriever.cache_dir / "no-docs"),
+    )
+    assert retriever.ann_index is not None
+    assert (retriever.embeddings_dir / "faiss.index").exists()
+
+    reloaded = ContextRetriever(
+        config_path=str(retriever.config_path),
+        embeddings_dir=str(retriever.embeddings_dir),
+        cache_dir=str(retriever.cache_dir),
+    )
+    reloaded.embedding_model = retriever.embedding_model
+    reloaded.use_embeddings = True
+    reloaded.similarity_threshold = 0.5
+    reloaded.ann_backend = "hnsw"
+    assert reloaded.load_index()
+    results = reloaded.retrieve_relevant_specs("database schema", top_k=3)
+
+    assert reloaded.doc_matrix is None
+    assert [r["path"] for r in results] == [r["path"] for r in expected]
+    assert results[0]["similarity"] == pytest.approx(expected[0]["similarity"], abs=1e-5)
+
+
+@pytest.mark.unit
+def test_embedding_store_cleanup_only_removes_legacy_pickles(tmp_path):
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir()
+    (specs_dir / "auth.md").write_text("# Auth\nauth tokens")
+    shared_dir = tmp_path / "embeddings"
+    shared_dir.mkdir()
+    legacy = shared_dir / f"auth_{'0' * 32}.pkl"
+    legacy.write_bytes(b"legacy")
+    (shared_dir / "notes.pkl").write_bytes(b"unrelated")
+
+    retriever = ContextRetriever(
+        config_path=str(tmp_path / "missing.conf"),
+        embeddings_dir=str(shared_dir),
+        cache_dir=str(shared_dir),
+    )
+    retriever.embedding_model = _KeywordEmbeddingModel()
+    retriever.use_embeddings = True
+    retriever.build_index(specs_dir=str(specs_dir), docs_dir=str(tmp_path / "no-docs"))
+    (specs_dir / "auth.md").write_text("# Auth\nauth auth tokens")
+    retriever.build_index(specs_dir=str(specs_dir), docs_dir=str(tmp_path / "no-docs"))
+
+    assert not legacy.exists()
+    assert (shared_dir / "notes.pkl").exists()
+    assert (shared_dir / "index.pkl").exists()
+
+
+@pytest.mark.unit
+def test_hnsw_index_from_another_save_is_ignored(retriever, caplog):
+    pytest.importorskip("faiss")
+    specs_dir = Path(retriever.documents[0]["path"]).parent
+    build = dict(specs_dir=str(specs_dir), docs_dir=str(retriever.cache_dir / "no-docs"))
+    retriever.ann_backend = "hnsw"
+    retriever.ann_min_documents = 1
+    retriever.build_index(**build)
+    stale_graph = (retriever.embeddings_dir / "faiss.index").read_bytes()
+    stale_key = (retriever.embeddings_dir / "faiss.json").read_bytes()
+
+    # Same document count, new contents; then the old graph left by a crash
+    (specs_dir / "frontend.md").write_text("# Frontend\nauth auth auth")
+    retriever.build_index(**build)
+    (retriever.embeddings_dir / "faiss.index").write_bytes(stale_graph)
+    (retriever.embeddings_dir / "faiss.json").write_bytes(stale_key)
+
+    reloaded = ContextRetriever(
+        config_path=str(retriever.config_path),
+        embeddings_dir=str(retriever.embeddings_dir),
+        cache_dir=str(retriever.cache_dir),
+    )
+    reloaded.embedding_model = retriever.embedding_model
+    reloaded.use_embeddings = True
+    reloaded.ann_backend = "hnsw"
+    reloaded.ann_min_documents = 1
+    assert reloaded.load_index()
+
+    assert "Ignoring stale FAISS index" in caplog.text
+    assert reloaded.doc_matrix is not None
+
+
+@pytest.mark.unit
+def test_load_index_memory_maps_stored_embeddings(retriever, monkeypatch):
+    expected = retriever.retrieve_relevant_specs("database schema", top_k=3)
+    assert sorted(p.name for p in retriever.cache_dir.iterdir()) == [
+        "embeddings.json", "embeddings.npy"
+    ]
+
+    reloaded = ContextRetriever(
+        config_path=str(retriever.config_path),
+        embeddings_dir=str(retriever.embeddings_dir),
+        cache_dir=str(retriever.cache_dir),
+    )
+    model = _KeywordEmbeddingModel()
+    calls = []
+    original_encode = model.encode
+
+    def counting_encode(sentences, **kwargs):
+        calls.append(len(sentences))
+        return original_encode(sentences, **kwargs)
+
+    monkeypatch.setattr(model, "encode", counting_encode)
+    reloaded.embedding_model = model
+    reloaded.use_embeddings = True
+    reloaded.similarity_threshold = 0.5
+    assert reloaded.load_index()
+
+    assert isinstance(reloaded.doc_matrix, np.memmap)
+    assert reloaded.retrieve_relevant_specs("database schema", top_k=3) == expected
+    assert calls == [1]
+
+
+@pytest.mark.unit
+def test_build_index_reads_specs_then_docs_and_skips_unreadable(tmp_path):
+    specs_dir, docs_dir = tmp_path / "specs", tmp_path / "docs"
+    specs_dir.mkdir()
+    docs_dir.mkdir()
+    (specs_dir / "spec.md").write_text("# Spec\nuser login")
+    (docs_dir / "adr.md").write_text("# ADR\ndatabase choice")
+    (docs_dir / "binary.md").write_bytes(b"\xff\xfe\x00invalid utf-8")
+
+    retriever = ContextRetriever(
+        config_path=str(tmp_path / "missing.conf"),
+        embeddings_dir=str(tmp_path / "embeddings"),
+        cache_dir=str(tmp_path / "embeddings" / "cache"),
+    )
+    retriever.use_embeddings = False
+    retriever.build_index(specs_dir=str(specs_dir), docs_dir=str(docs_dir))
+
+    assert [Path(d["path"]).name for d in retriever.documents] == ["spec.md", "adr.md"]
+    assert len(retriever.tfidf_search.documents) == 2
+
+
+@pytest.mark.unit
+def test_embedding_model_loads_lazily_and_only_once(tmp_path, monkeypatch):
+    attempts = []
+
+    def failing_load(self):
+        attempts.append(self)
+        self._model_load_attempted = True
+        self.use_embeddings = False
+
+    monkeypatch.setattr(ContextRetriever, "_try_load_embeddings_model", failing_load)
+    retriever = ContextRetriever(
+        config_path=str(tmp_path / "missing.conf"),
+        embeddings_dir=str(tmp_path / "embeddings"),
+        cache_dir=str(tmp_path / "embeddings" / "cache"),
+    )
+    assert attempts == []
+    assert retriever.use_embeddings is None
+
+    assert retriever.embedding_model is None
+    assert retriever.embedding_model is None
+    assert len(attempts) == 1
+    assert retriever.use_embeddings is False
+
+
+@pytest.mark.unit
+def test_load_index_restores_tfidf_matrix_without_tokenizing(tmp_path, monkeypatch):
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir()
+    (specs_dir / "auth.md").write_text("# Auth\nJWT authentication tokens")
+    (specs_dir / "db.md").write_text("# Database\nschema migrations")
+    paths = dict(
+        config_path=str(tmp_path / "missing.conf"),
+        embeddings_dir=str(tmp_path / "embeddings"),
+        cache_dir=str(tmp_path / "embeddings" / "cache"),
+    )
+    built = ContextRetriever(**paths)
+    built.use_embeddings = False
+    built.build_index(specs_dir=str(specs_dir), docs_dir=str(tmp_path / "no-docs"))
+    expected = built.retrieve_relevant_specs("jwt tokens", top_k=2)
+
+    reloaded = ContextRetriever(**paths)
+    reloaded.use_embeddings = False
+    monkeypatch.setattr(TFIDFSearch, "add_document", lambda *a, **kw: pytest.fail("re-tokenized"))
+    assert reloaded.load_index()
+
+    assert reloaded.retrieve_relevant_specs("jwt tokens", top_k=2) == expected
+    assert reloaded.tfidf_search.vocab == built.tfidf_search.vocab
+
+
+
+@pytest.mark.unit
+def test_index_stores_texts_in_content_blob_not_pickle(tmp_path):
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir()
+    (specs_dir / "auth.md").write_text("# Auth\nJWT authentication tokens")
+    (specs_dir / "i18n.md").write_text("# Übersetzung\nGröße café")
+    paths = dict(
+        config_path=str(tmp_path / "missing.conf"),
+        embeddings_dir=str(tmp_path / "embeddings"),
+        cache_dir=str(tmp_path / "embeddings" / "cache"),
+    )
+    built = ContextRetriever(**paths)
+    built.use_embeddings = False
+    built.build_index(specs_dir=str(specs_dir), docs_dir=str(tmp_path / "no-docs"))
+
+    with open(tmp_path / "embeddings" / "index.pkl", "rb") as f:
+        stored = pickle.load(f)
+    assert all("content" not in doc for doc in stored["documents"])
+
+    reloaded = ContextRetriever(**paths)
+    reloaded.use_embeddings = False
+    assert reloaded.load_index()
+
+    results = reloaded.retrieve_relevant_specs("größe jwt", top_k=2)
+    assert {Path(r["path"]).name: r["content"] for r in results} == {
+        "auth.md": "# Auth\nJWT authentication tokens",
+        "i18n.md": "# Übersetzung\nGröße café",
+    }
+
+@pytest.mark.unit
+def test_load_index_rejects_content_blob_from_another_save(tmp_path):
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir()
+    (specs_dir / "auth.md").write_text("# Auth\nJWT authentication tokens")
+    (specs_dir / "db.md").write_text("# DB\nschema migrations")
+    embeddings_dir = tmp_path / "embeddings"
+    paths = dict(
+        config_path=str(tmp_path / "missing.conf"),
+        embeddings_dir=str(embeddings_dir),
+        cache_dir=str(embeddings_dir / "cache"),
+    )
+    built = ContextRetriever(**paths)
+    built.use_embeddings = False
+    built.build_index(specs_dir=str(specs_dir), docs_dir=str(tmp_path / "no-docs"))
+    index_pkl = (embeddings_dir / "index.pkl").read_bytes()
+
+    # Same document count, new texts: a crash after contents.bin was replaced
+    (specs_dir / "auth.md").write_text("# Auth\nOAuth device flow")
+    built.build_index(specs_dir=str(specs_dir), docs_dir=str(tmp_path / "no-docs"))
+    (embeddings_dir / "index.pkl").write_bytes(index_pkl)
+
+    reloaded = ContextRetriever(**paths)
+    reloaded.use_embeddings = False
+    assert not reloaded.load_index()
+    assert not list(embeddings_dir.glob("*.tmp"))
+
+
+@pytest.mark.unit
+def test_chunk_markdown_packs_sections_and_windows_long_ones():
+    short = "# Title\nintro words here\n"
+    assert _chunk_markdown(short, max_tokens=10, overlap=2) == [short]
+
+    content = (
+        "# Spec\nalpha beta\n"
+        "## Small\ngamma delta\n"
+        "## Large\n" + " ".join(f"w{i}" for i in range(12)) + "\n"
+    )
+    chunks = _chunk_markdown(content, max_tokens=8, overlap=2)
+
+    assert chunks[0] == "# Spec\nalpha beta\n## Small\ngamma delta\n"
+    assert chunks[1] == "## Large\nw0 w1 w2 w3 w4 w5"
+    assert chunks[2].split()[:2] == chunks[1].split()[-2:]
+    assert chunks[-1].endswith("w11")
+    assert all(len(chunk.split()) <= 8 for chunk in chunks)
+
+
+@pytest.mark.unit
+def test_long_files_are_indexed_as_chunks_and_deduplicated(tmp_path):
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir()
+    filler = " ".join(["requirement"] * 30)
+    (specs_dir / "auth.md").write_text(
+        f"# Auth\n## Login\njwt login {filler}\n## Tokens\njwt refresh {filler}\n"
+    )
+    (specs_dir / "db.md").write_text("# Database\njwt audit table")
+
+    retriever = ContextRetriever(
+        config_path=str(tmp_path / "missing.conf"),
+        embeddings_dir=str(tmp_path / "embeddings"),
+        cache_dir=str(tmp_path / "embeddings" / "cache"),
+    )
+    retriever.use_embeddings = False
+    retriever.chunk_max_tokens = 40
+    retriever.build_index(specs_dir=str(specs_dir), docs_dir=str(tmp_path / "no-docs"))
+
+    assert sorted(Path(d["path"]).name for d in retriever.documents) == [
+        "auth.md#chunk0", "auth.md#chunk1", "db.md"
+    ]
+    results = retriever.retrieve_relevant_specs("jwt refresh", top_k=2, dedupe_files=True)
+    assert [Path(r["path"]).name for r in results] == ["auth.md#chunk1", "db.md"]
+
+
+@pytest.mark.unit
+def test_rebuild_rereads_only_changed_files(retriever, monkeypatch):
+    specs_dir = Path(retriever.documents[0]["path"]).parent
+    build = dict(specs_dir=str(specs_dir), docs_dir=str(specs_dir / "no-docs"))
+    read = []
+    original_read = retriever._read_documents
+
+    def tracking_read(file_path):
+        read.append(file_path.name)
+        return original_read(file_path)
+
+    monkeypatch.setattr(retriever, "_read_documents", tracking_read)
+    monkeypatch.setattr(retriever, "_build_doc_matrix", lambda: pytest.fail("rebuilt"))
+    retriever.build_index(**build)
+    assert read == []
+
+    (specs_dir / "frontend.md").write_text("# Frontend\nfrontend auth widgets and more text")
+    monkeypatch.undo()
+    monkeypatch.setattr(retriever, "_read_documents", tracking_read)
+    retriever.build_index(**build)
+
+    assert read == ["frontend.md"]
+    assert len(retriever.documents) == 3
+    assert retriever.doc_matrix.shape[0] == 3
+    assert "widgets" in retriever.tfidf_search.vocab
+
+
+@pytest.mark.unit
+def test_config_is_parsed_once_per_file_version(tmp_path):
+    config_file = tmp_path / "refinement.conf"
+    config_file.write_text('# Retrieval\nTOP_K_RESULTS=3\nEMBEDDING_MODEL="mini"\n')
+    paths = dict(
+        config_path=str(config_file),
+        embeddings_dir=str(tmp_path / "embeddings"),
+        cache_dir=str(tmp_path / "embeddings" / "cache"),
+    )
+
+    first, second = ContextRetriever(**paths), ContextRetriever(**paths)
+    assert first.config is second.config
+    assert first.config["EMBEDDING_MODEL"] == "mini"
+    assert first.top_k == 3
+
+    config_file.write_text("TOP_K_RESULTS=7\n# edited\n")
+    assert ContextRetriever(**paths).top_k == 7